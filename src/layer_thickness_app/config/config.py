@@ -2,14 +2,44 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 from qfluentwidgets import Theme
 
+# orjson is an optional speed-up; the stdlib json module is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: dict) -> bytes:
+    # config.json is written by the app, not edited by hand, so it is
+    # stored compact rather than pretty-printed.
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # only need to handle the stdlib exception.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_THEME_MAP: dict[str, Theme] = {
+    "Dark":  Theme.DARK,
+    "Light": Theme.LIGHT,
+    "Auto":  Theme.AUTO,
+}
+
+
 class AppConfig(QObject):
     """
     Persistent application configuration backed by ``config.json``.
@@ -24,7 +54,7 @@ class AppConfig(QObject):
     language_changed    = pyqtSignal(str)
     window_size_changed = pyqtSignal(str)
     # Emitted with the new exposure in ms (float). Signals subscribers
-    # that the value has been written to disk.
+    # that the value has been stored (the disk write is debounced).
     camera_exposure_changed = pyqtSignal(float)
 
     DEFAULT_CONFIG = {
@@ -56,91 +86,156 @@ class AppConfig(QObject):
     # can be calculated.
     PLAUSIBILITY_GRAY_MEAN_MIN: float = 0.5
 
+    # Setter writes are coalesced: a burst of changes (theme toggling,
+    # window resizing) lands on disk once the settings have been quiet
+    # for this long.
+    SAVE_DEBOUNCE_MS: int = 250
+
     def __init__(self):
         super().__init__()
         self.config_path = Path(__file__).resolve().parent / "config.json"
+        self._config_dir  = self.config_path.parent
         self._config_data: dict = {}
+        self._dirty = False
+        # Created lazily: the module-level ``cfg`` is instantiated before
+        # the QApplication exists, and timers need an event loop.
+        self._flush_timer: QTimer | None = None
+
+        # The directory is created once here rather than on every save.
+        try:
+            self._config_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error("Error creating config directory %s: %s",
+                         self._config_dir, e)
+
         self.load()
 
     # ------------------------------------------------------------------
 
-    def _get_theme_enum(self, theme_str: str) -> Theme:
-        if theme_str == "Dark":
-            return Theme.DARK
-        if theme_str == "Light":
-            return Theme.LIGHT
-        return Theme.AUTO
+    def _refresh_cache(self):
+        """
+        Snapshot the hot read-only settings into plain attributes so the
+        properties (queried on every repaint / theme lookup) skip the
+        dict lookups. Setters keep the snapshot in sync.
+        """
+        self._theme_str   = self._config_data.get("theme", "Auto")
+        self._theme_enum  = _THEME_MAP.get(self._theme_str, Theme.AUTO)
+        self._language    = self._config_data.get("language", "English")
+        self._window_size = self._config_data.get("window_size", "1100x800")
 
     def load(self):
+        needs_write = True
         try:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            logger.error("Error creating config directory %s: %s",
-                         self.config_path.parent, e)
-
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self._config_data = json.load(f)
-                for key, value in self.DEFAULT_CONFIG.items():
-                    self._config_data.setdefault(key, value)
-            except json.JSONDecodeError:
-                logger.error("Error reading config file %s. Loading defaults.",
-                             self.config_path)
-                self._config_data = self.DEFAULT_CONFIG.copy()
-        else:
+            with open(self.config_path, "rb") as f:
+                self._config_data = _loads(f.read())
+            on_disk = dict(self._config_data)
+            for key, value in self.DEFAULT_CONFIG.items():
+                self._config_data.setdefault(key, value)
+            # Only rewrite the file if defaults had to be merged in.
+            needs_write = self._config_data != on_disk
+        except FileNotFoundError:
             logger.info("No config file found. Creating with defaults at %s",
                         self.config_path)
             self._config_data = self.DEFAULT_CONFIG.copy()
+        except json.JSONDecodeError:
+            logger.error("Error reading config file %s. Loading defaults.",
+                         self.config_path)
+            self._config_data = self.DEFAULT_CONFIG.copy()
 
-        self.save()
+        self._refresh_cache()
+
+        if needs_write:
+            self.save()
 
     def save(self):
+        """
+        Write the config to disk immediately. The JSON goes to a sibling
+        temp file first and is swapped in with ``os.replace`` so a crash
+        mid-write never leaves a truncated ``config.json`` behind.
+        """
+        tmp_path = f"{self.config_path}.tmp"
         try:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config_data, f, indent=4)
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(self._config_data))
+            os.replace(tmp_path, self.config_path)
+            self._dirty = False
         except OSError as e:
             logger.error("Error saving config file: %s", e)
 
+    def _schedule_save(self):
+        """Mark the config dirty and (re)start the debounced flush."""
+        self._dirty = True
+        if self._flush_timer is None:
+            app = QCoreApplication.instance()
+            if app is None:
+                # No event loop to debounce on -- write through.
+                self.save()
+                return
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+            self._flush_timer.timeout.connect(self._flush)
+            # Pending changes must not be lost if the app quits inside
+            # the debounce window.
+            app.aboutToQuit.connect(self._flush)
+        self._flush_timer.start()
+
+    def _flush(self):
+        if self._dirty:
+            self.save()
+
     # --- Theme -------------------------------------------------------
 
     @property
     def theme(self) -> str:
-        return self._config_data.get("theme", "Auto")
+        return self._theme_str
 
     @property
     def theme_enum(self) -> Theme:
-        return self._get_theme_enum(self.theme)
+        return self._theme_enum
+
+    # Setters return early when the value is unchanged: no write is
+    # scheduled and no signal fires, so listeners (e.g. the app-wide
+    # restyle on theme_changed) don't re-run for redundant calls.
 
     def set_theme(self, theme_str: str):
-        if theme_str in ("Light", "Dark", "Auto"):
+        if theme_str == self._theme_str:
+            return
+        if theme_str in _THEME_MAP:
             self._config_data["theme"] = theme_str
-            self.save()
+            self._theme_str  = theme_str
+            self._theme_enum = _THEME_MAP[theme_str]
+            self._schedule_save()
             self.theme_changed.emit(self.theme_enum)
 
     # --- Language ----------------------------------------------------
 
     @property
     def language(self) -> str:
-        return self._config_data.get("language", "English")
+        return self._language
 
     def set_language(self, language_str: str):
+        if language_str == self._language:
+            return
         if language_str in ("English", "German"):
             self._config_data["language"] = language_str
-            self.save()
+            self._language = language_str
+            self._schedule_save()
             self.language_changed.emit(language_str)
 
     # --- Window Size -------------------------------------------------
 
     @property
     def window_size(self) -> str:
-        return self._config_data.get("window_size", "1100x800")
+        return self._window_size
 
     def set_window_size(self, size_str: str):
+        if size_str == self._window_size:
+            return
         if "x" in size_str or size_str == "Fullscreen":
             self._config_data["window_size"] = size_str
-            self.save()
+            self._window_size = size_str
+            self._schedule_save()
             self.window_size_changed.emit(size_str)
 
     # --- Camera exposure ---------------------------------------------
@@ -164,11 +259,11 @@ class AppConfig(QObject):
 
     def set_camera_exposure_ms(self, value_ms: float | None) -> None:
         """Persist a camera exposure override. Pass None to clear it."""
-        if value_ms is None:
-            self._config_data["camera_exposure_ms"] = None
-        else:
-            self._config_data["camera_exposure_ms"] = float(value_ms)
-        self.save()
+        new_value = None if value_ms is None else float(value_ms)
+        if new_value == self._config_data.get("camera_exposure_ms"):
+            return
+        self._config_data["camera_exposure_ms"] = new_value
+        self._schedule_save()
         # Emit only for non-null updates so listeners don't have to
         # special-case "clear".
         if value_ms is not None:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import cv2
-import uuid
+import os
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtGui     import QIcon
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore    import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 from layer_thickness_app.gui.main_window                  import MainWindow
 from layer_thickness_app.services.camera_service          import (
@@ -32,10 +34,218 @@ from layer_thickness_app.config.config                    import AppConfig
 
 logger = logging.getLogger(__name__)
 
-BASE_DIR    = Path(__file__).resolve().parent.parent
-ICON_PATH   = BASE_DIR / "gui" / "resources" / "icons" / "app_icon.svg"
 DEFAULT_DB  = Path("data") / "measurements.db"
 
+# zlib settings for the archived PNGs. Level 1 stays lossless but is
+# several times cheaper to encode than libpng's default, and the RLE
+# strategy skips deflate's match search entirely (runs only), which is
+# where most of the remaining encode time goes. After PNG's row filters
+# camera frames are mostly small residuals, so the extra disk space is
+# modest next to the save latency.
+PNG_COMPRESSION_LEVEL = 1
+
+# Operator-facing name of each capture slot ("material" is the sample).
+_CAPTURE_LABELS = {"reference": "reference", "material": "sample"}
+
+
+class CaptureWorkerSignals(QObject):
+    """Signals emitted by CaptureWorker."""
+
+    done = pyqtSignal(object)   # FrameCaptureResult | None
+
+
+class CaptureWorker(QRunnable):
+    """
+    Runs ``CameraService.capture_frame`` on a QThreadPool thread. A
+    multi-frame capture blocks in ``is_FreezeVideo`` once per frame, so
+    on the GUI thread a 30-frame average froze the window for its whole
+    duration.
+    """
+
+    def __init__(
+        self,
+        camera_service: CameraService,
+        n_frames:       int,
+        wavelength_um:  float,
+    ):
+        super().__init__()
+        self.camera_service = camera_service
+        self.n_frames       = n_frames
+        self.wavelength_um  = wavelength_um
+        self.signals        = CaptureWorkerSignals()
+
+    def run(self):
+        try:
+            capture = self.camera_service.capture_frame(
+                n_frames=self.n_frames, wavelength_um=self.wavelength_um,
+            )
+        except Exception as e:
+            logger.exception("UNHANDLED EXCEPTION in capture: %s", e)
+            capture = None
+        self.signals.done.emit(capture)
+
+
+class CalcWorkerSignals(QObject):
+    """Signals emitted by CalcWorker."""
+
+    # (thickness_nm | None, error_msg | None, capture_stats)
+    done   = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+
+
+class CalcWorker(QRunnable):
+    """
+    Runs ``CalculationService.calculate_thickness_from_captures`` on a
+    QThreadPool thread so the material lookup and Beer-Lambert pipeline
+    never block the event loop. Everything that touches widgets or the
+    calibration DB stays on the UI thread in the ``done`` slot.
+    """
+
+    def __init__(
+        self,
+        calculation_service: CalculationService,
+        ref_capture:         FrameCaptureResult,
+        mat_capture:         FrameCaptureResult,
+        shelf: str, book: str, page: str,
+        wavelength_um:       float,
+    ):
+        super().__init__()
+        self.calculation_service = calculation_service
+        self.ref_capture   = ref_capture
+        self.mat_capture   = mat_capture
+        self.shelf         = shelf
+        self.book          = book
+        self.page          = page
+        self.wavelength_um = wavelength_um
+        self.signals       = CalcWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.calculation_service.calculate_thickness_from_captures(
+                self.ref_capture, self.mat_capture,
+                self.shelf, self.book, self.page, self.wavelength_um,
+            )
+        except Exception as e:
+            logger.exception("UNHANDLED EXCEPTION in calculation: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(*result)
+
+
+def _encode_png(image) -> memoryview:
+    """
+    PNG-encode a contiguous frame. The result is a view on OpenCV's
+    output buffer, which file writes accept directly, so no
+    ``tobytes()`` copy is made.
+    """
+    import cv2
+
+    ok, buf = cv2.imencode(".png", image, [
+        cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION_LEVEL,
+        cv2.IMWRITE_PNG_STRATEGY,    cv2.IMWRITE_PNG_STRATEGY_RLE,
+    ])
+    if not ok:
+        raise ValueError("cv2.imencode failed to encode PNG")
+    return memoryview(buf)
+
+
+def _frame_digest(image) -> str:
+    """Content hash of a contiguous frame (shape and dtype included)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{image.shape}{image.dtype}".encode())
+    h.update(image.data)
+    return h.hexdigest()
+
+
+class SaveWorkerSignals(QObject):
+    """Signals emitted by SaveWorker (a QRunnable can't own signals)."""
+
+    finished = pyqtSignal(int)   # new row id
+    error    = pyqtSignal(str)
+
+
+class SaveWorker(QRunnable):
+    """
+    Writes the reference/sample PNGs and inserts the measurement row on a
+    QThreadPool thread, so PNG encoding and the SQLite commit don't stall
+    the GUI after every calculation. ``db_data`` is built on the UI
+    thread; the worker only adds the image filenames and performs I/O.
+
+    Images are content-addressed: the filename is a hash of the frame,
+    so a frame that is already on disk (typically the reference reused
+    for a whole series of samples) is neither encoded nor written again.
+    """
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        db_data:    dict[str, Any],
+        ref_image,
+        mat_image,
+        image_dir:  Path,
+    ):
+        super().__init__()
+        self.db_service = db_service
+        self.db_data    = db_data
+        self.image_dir  = image_dir
+        self.ref_image  = ref_image
+        self.mat_image  = mat_image
+        self.signals    = SaveWorkerSignals()
+
+    def _store_png(self, prefix: str, image) -> str:
+        """Write ``image`` unless its content is already stored; return the filename."""
+        import numpy as np
+
+        # One contiguous copy up front (a no-op for camera frames) keeps
+        # imencode on its direct row path and lets the hash read the
+        # buffer without a tobytes() copy. The dtype is left alone: PNG
+        # stores 16-bit frames losslessly, so narrowing them would lose
+        # data.
+        image = np.ascontiguousarray(image)
+        name  = f"{prefix}_{_frame_digest(image)}.png"
+        path  = self.image_dir / name
+        if not path.exists():
+            # Write-then-rename so a concurrent save of the same frame
+            # never exposes a half-written file under the final name.
+            tmp = path.with_name(f"{name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(_encode_png(image))
+            os.replace(tmp, path)
+        return name
+
+    def run(self):
+        try:
+            # cv2.imencode releases the GIL, so the two PNGs encode in
+            # parallel; unpacking re-raises the first failure here.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                ref_name, mat_name = pool.map(
+                    self._store_png, ("ref", "mat"), (self.ref_image, self.mat_image),
+                )
+            self.db_data["RefImage"] = ref_name
+            self.db_data["MatImage"] = mat_name
+
+            row_id = self.db_service.save_measurement(self.db_data)
+            if row_id <= 0:
+                raise RuntimeError("DatabaseService.save_measurement returned -1")
+
+            # A file found on disk above may have belonged only to a row
+            # deleted before this INSERT, and been unlinked with it. Once
+            # the row is committed, deletes see it referencing the file,
+            # so restoring any missing file now closes that window.
+            for prefix, image, name in (
+                ("ref", self.ref_image, ref_name),
+                ("mat", self.mat_image, mat_name),
+            ):
+                if not (self.image_dir / name).exists():
+                    logger.warning("Image %s vanished during save; rewriting.", name)
+                    self._store_png(prefix, image)
+            # Don't pin the raw frames for the rest of the worker's lifetime.
+            self.ref_image = self.mat_image = None
+        except Exception as e:
+            logger.exception("Failed to save measurement: %s", e)
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(row_id)
+
 
 class MainController:
     """Orchestrates services and the main window."""
@@ -45,9 +255,10 @@ class MainController:
 
         # Core services
         self.db_service           = DatabaseService(str(DEFAULT_DB))
+        # Fixed for the life of the DB connection; handed to every SaveWorker.
+        self._image_dir           = self.db_service.image_dir_path
         self.export_service       = ExportService(self.db_service)
         self.import_service       = ImportService(self.db_service)
-        self.material_service     = MaterialService()
         self.plausibility_service = PlausibilityService()
         self.calculation_service  = CalculationService(
             plausibility_service=self.plausibility_service,
@@ -56,6 +267,17 @@ class MainController:
         self.calibration_service  = CalibrationService(db_service=self.db_service)
         self.msa_service          = MSAService()
 
+        # True while a CaptureWorker owns the camera; further capture
+        # requests are ignored until it reports back.
+        self._capture_busy = False
+
+        # True from the start of a calculation until it and its save (if
+        # any) have settled; further calculations are refused meanwhile.
+        self._calc_busy = False
+        # Probe of a batch whose last run is still calculating/saving; the
+        # batch is reported complete (or not) once that run settles.
+        self._batch_finish_probe: str | None = None
+
         # Currently selected MaterialProfile, refreshed on material change.
         self._active_profile: MaterialProfile | None = None
 
@@ -70,31 +292,39 @@ class MainController:
             config              = self.config,
         )
 
-        if ICON_PATH.exists():
-            self.view.setWindowIcon(QIcon(str(ICON_PATH)))
-        else:
-            logger.warning("Icon file not found at %s", ICON_PATH)
-
         self.measurement_page  = self.view.measure_interface
         self.calibration_page  = self.view.calibration_interface
         self.validation_page   = self.view.validation_interface
         self.history_page      = self.view.history_interface
 
-        try:
-            self.measurement_page.populate_material_selector(
-                self.material_service.get_material_data()
-            )
-        except Exception as e:
-            logger.error("Couldn't load material data: %s", e)
-
         self._connect_signals()
 
+    @cached_property
+    def material_service(self) -> MaterialService:
+        """
+        Built on first use rather than in ``__init__``: loading the material
+        catalog is the slowest part of startup, and nothing needs it before
+        the window has painted (see ``show_window``).
+        """
+        return MaterialService(db_service=self.db_service)
+
     # ------------------------------------------------------------------
     # Window lifecycle
     # ------------------------------------------------------------------
 
     def show_window(self):
         self.view.show()
+        # Fill the material selector once the event loop has drawn the
+        # window, so the catalog load doesn't delay the first paint.
+        QTimer.singleShot(0, self._populate_material_selector)
+
+    def _populate_material_selector(self):
+        try:
+            self.measurement_page.populate_material_selector(
+                self.material_service.get_material_data()
+            )
+        except Exception as e:
+            logger.error("Couldn't load material data: %s", e)
 
     def shutdown(self) -> None:
         """
@@ -102,8 +332,12 @@ class MainController:
         the camera and closes the SQLite connection so the WAL/SHM
         sidecar files don't linger.
         """
+        # Let in-flight captures, calculations, saves and imports finish
+        # first; a SaveWorker hitting a closed connection would lose its
+        # row and leave its PNGs orphaned.
+        QThreadPool.globalInstance().waitForDone()
         try:
-            if self.camera_service.get_status().get("connected"):
+            if self.camera_service.is_connected:
                 self.camera_service.disconnect()
         except Exception as e:
             logger.debug("Camera disconnect on shutdown failed: %s", e)
@@ -117,42 +351,40 @@ class MainController:
     # ------------------------------------------------------------------
 
     def _connect_signals(self):
-        # Measure page
-        self.measurement_page.calculation_requested.connect(self.on_start_calc)
-        self.measurement_page.capture_reference_requested.connect(self.on_take_reference_image)
-        self.measurement_page.capture_material_requested.connect(self.on_take_material_image)
-        self.measurement_page.reset_requested.connect(self.on_reset_measurement)
-        self.measurement_page.config_changed.connect(self._on_measure_config_changed)
-        self.measurement_page.material_changed.connect(self._on_material_changed)
-        # Batch-mode capture: emitted by the Sample button when batch
-        # mode is active. Without this connection the batch UI is inert.
-        self.measurement_page.batch_sample_requested.connect(
-            self.on_batch_sample_capture
-        )
+        # All connections keep Qt's default AutoConnection. Page signals are
+        # emitted on the GUI thread, where that already dispatches directly;
+        # the worker signals cross threads and must stay queued.
+
+        # Measure page. Every name here is a pyqtSignal on MeasurePage; a
+        # missing one raises AttributeError at startup. batch_sample_requested
+        # is emitted by the Sample button in batch mode -- without it the
+        # batch UI is inert.
+        page = self.measurement_page
+        for signal_name, slot in (
+            ("calculation_requested",       self.on_start_calc),
+            ("capture_reference_requested", partial(self.on_take_image, "reference")),
+            ("capture_material_requested",  partial(self.on_take_image, "material")),
+            ("reset_requested",             self.on_reset_measurement),
+            ("config_changed",              self._on_measure_config_changed),
+            ("material_changed",            self._on_material_changed),
+            ("batch_sample_requested",      self.on_batch_sample_capture),
+        ):
+            getattr(page, signal_name).connect(slot)
 
         # Calibration page
-        try:
-            self.calibration_page.calibration_activated.connect(
-                self._on_calibration_activated
-            )
-        except AttributeError as e:
-            logger.warning("Calibration page signal not connected: %s", e)
+        self.calibration_page.calibration_activated.connect(
+            self._on_calibration_activated
+        )
 
-        # Cross-page refresh hooks
-        try:
-            self.history_page.data_changed.connect(
-                self.view.csv_interface._load_filter_suggestions
-            )
-            self.view.csv_interface.data_changed.connect(
-                self.history_page._load_name_suggestions
-            )
-            self.history_page.data_changed.connect(self.calibration_page.refresh_data)
-            self.history_page.data_changed.connect(self.validation_page.refresh_data)
-            self.view.csv_interface.data_changed.connect(self.calibration_page.refresh_data)
-            self.view.csv_interface.data_changed.connect(self.validation_page.refresh_data)
-            logger.info("Connected data_changed signals between pages.")
-        except AttributeError as e:
-            logger.warning("Could not connect data_changed signals: %s", e)
+        # Cross-page refresh hooks. Every page exposes these signals and
+        # slots; a missing one is a wiring bug and should fail at startup.
+        csv_page = self.view.csv_interface
+        self.history_page.data_changed.connect(csv_page._load_filter_suggestions)
+        self.history_page.data_changed.connect(self.calibration_page.refresh_data)
+        self.history_page.data_changed.connect(self.validation_page.refresh_data)
+        csv_page.data_changed.connect(self.history_page._load_name_suggestions)
+        csv_page.data_changed.connect(self.calibration_page.refresh_data)
+        csv_page.data_changed.connect(self.validation_page.refresh_data)
 
     def _on_measure_config_changed(self):
         self.measurement_page.set_calculation_enabled(True)
@@ -161,12 +393,12 @@ class MainController:
     # MaterialProfile wiring
     # ------------------------------------------------------------------
 
-    def _on_material_changed(self, path: str | None):
+    def _on_material_changed(self, material: tuple[str, str, str] | None):
         """
         Refresh the per-material plausibility profile and update UI hints
         whenever the operator picks a new material.
         """
-        if not path:
+        if material is None:
             self._active_profile = None
             self.plausibility_service = PlausibilityService()
             self.calculation_service.plausibility = self.plausibility_service
@@ -174,13 +406,7 @@ class MainController:
             self.measurement_page.set_reference_thickness_hint(None, None)
             return
 
-        try:
-            shelf, book, page = path.split("/")
-        except ValueError:
-            logger.debug("Invalid material path: %s", path)
-            return
-
-        profile = get_profile(shelf, book, page)
+        profile = get_profile(*material)
         self._active_profile = profile
 
         # Build a profile-bound plausibility instance and hand it to the
@@ -223,57 +449,59 @@ class MainController:
         logger.info("Resetting measurement page.")
         self.measurement_page.reset_all()
 
-    def on_take_reference_image(self):
+    def on_take_image(self, kind: str):
+        """Capture into the ``kind`` slot: "reference" or "material"."""
         if not self._require_camera_connected():
             return
         n_frames = self.measurement_page.get_frame_count()
-        wavelength_um = self._active_wavelength_um()
-        self.measurement_page.set_result_text(
-            f"Capturing reference ({n_frames} frame{'s' if n_frames > 1 else ''})..."
+        self._start_capture(
+            f"Capturing {_CAPTURE_LABELS[kind]} "
+            f"({n_frames} frame{'s' if n_frames > 1 else ''})...",
+            n_frames, partial(self._on_image_captured, kind),
         )
-        QApplication.processEvents()
 
-        capture = self.camera_service.capture_frame(
-            n_frames=n_frames, wavelength_um=wavelength_um,
-        )
+    def _on_image_captured(self, kind: str, capture: FrameCaptureResult | None):
         if capture is None:
-            self._fail("Capture Error",
-                       "Failed to capture reference image. Check camera connection.")
+            self._fail(
+                "Capture Error",
+                f"Failed to capture {_CAPTURE_LABELS[kind]} image. "
+                f"Check camera connection.",
+            )
             return
 
-        self.measurement_page.set_capture(capture, "reference")
-        self.measurement_page.set_result_text("Result...")
-        self.measurement_page.set_calculation_enabled(True)
-        self._surface_plausibility(
-            self.plausibility_service.check_reference_capture(capture)
-        )
+        page = self.measurement_page
+        page.set_capture(capture, kind)
+        page.set_result_text("Result...")
+        page.set_calculation_enabled(True)
 
-    def on_take_material_image(self):
-        if not self._require_camera_connected():
-            return
-        n_frames = self.measurement_page.get_frame_count()
-        wavelength_um = self._active_wavelength_um()
-        self.measurement_page.set_result_text(
-            f"Capturing sample ({n_frames} frame{'s' if n_frames > 1 else ''})..."
-        )
-        QApplication.processEvents()
+        if kind == "reference":
+            result = self.plausibility_service.check_reference_capture(capture)
+        else:
+            result = self.plausibility_service.check_sample_capture(
+                capture, page.reference_capture,
+            )
+        self._surface_plausibility(result)
 
-        capture = self.camera_service.capture_frame(
-            n_frames=n_frames, wavelength_um=wavelength_um,
-        )
-        if capture is None:
-            self._fail("Capture Error",
-                       "Failed to capture sample image. Check camera connection.")
+    def _start_capture(self, status_text: str, n_frames: int, on_done) -> None:
+        """
+        Start a CaptureWorker and route its result to ``on_done`` on the
+        GUI thread. Requests arriving while a capture runs are dropped.
+        """
+        if self._capture_busy:
+            logger.info("Capture already in progress; ignoring request.")
             return
+        self._capture_busy = True
+        self.measurement_page.set_result_text(status_text)
 
-        self.measurement_page.set_capture(capture, "material")
-        self.measurement_page.set_result_text("Result...")
-        self.measurement_page.set_calculation_enabled(True)
-
-        ref_cap = self.measurement_page.reference_capture
-        self._surface_plausibility(
-            self.plausibility_service.check_sample_capture(capture, ref_cap)
+        worker = CaptureWorker(
+            self.camera_service, n_frames, self._active_wavelength_um(),
         )
+        worker.signals.done.connect(partial(self._on_capture_done, on_done))
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_capture_done(self, on_done, capture: FrameCaptureResult | None):
+        self._capture_busy = False
+        on_done(capture)
 
     # ------------------------------------------------------------------
     # Batch mode
@@ -325,20 +553,27 @@ class MainController:
                 ui["probe"], ui["reference_thickness_nm"], total,
             )
 
+        if self._capture_busy:
+            logger.info("Capture already in progress; ignoring batch request.")
+            return
+        if self._calc_busy:
+            logger.info("Previous run still calculating; ignoring batch request.")
+            return
+
         page.batch_advance()
 
-        n_frames      = page.get_frame_count()
-        wavelength_um = self._active_wavelength_um()
-        page.set_result_text(
+        n_frames = page.get_frame_count()
+        self._start_capture(
             f"Batch run {page.batch_current_run()}/"
             f"{page.batch_total_runs()} - capturing sample "
-            f"({n_frames} frame{'s' if n_frames > 1 else ''})..."
+            f"({n_frames} frame{'s' if n_frames > 1 else ''})...",
+            n_frames, partial(self._on_batch_sample_captured, ui),
         )
-        QApplication.processEvents()
 
-        capture = self.camera_service.capture_frame(
-            n_frames=n_frames, wavelength_um=wavelength_um,
-        )
+    def _on_batch_sample_captured(
+        self, ui: dict[str, Any], capture: FrameCaptureResult | None,
+    ):
+        page = self.measurement_page
         if capture is None:
             self._fail("Batch Capture Error", "Failed to capture sample.")
             return
@@ -355,41 +590,75 @@ class MainController:
         # forced on via the batch lifecycle).
         page.keep_reference_checkbox.setChecked(True)
         page.save_measurement_checkbox.setChecked(True)
-        self.on_start_calc()
+        last_run = page.batch_current_run() >= page.batch_total_runs()
+        if last_run:
+            self._batch_finish_probe = ui["probe"]
+        # The calculation runs on a worker; the batch is wrapped up by
+        # _on_calc_settled once the last run has been calculated and saved.
+        if not self.on_start_calc() and last_run:
+            self._finish_pending_batch(ok=False)
+
+    def _on_calc_settled(self, ok: bool) -> None:
+        """
+        Common tail of a calculation and its save: frees the calculation
+        slot and, after a batch's last run, reports the batch outcome.
+        """
+        self._calc_busy = False
+        self._finish_pending_batch(ok)
+
+    def _finish_pending_batch(self, ok: bool) -> None:
+        probe = self._batch_finish_probe
+        if probe is None:
+            return
+        self._batch_finish_probe = None
 
-        if page.batch_current_run() >= page.batch_total_runs():
-            page.batch_finish()
-            logger.info("Batch finished after %d runs.", page.batch_current_run())
+        page  = self.measurement_page
+        total = page.batch_total_runs()
+        page.batch_finish()
+        if ok:
+            logger.info("Batch finished after %d runs.", total)
             page.show_info_bar(
                 "Batch Complete",
-                f"Captured {page.batch_total_runs()} runs for probe "
-                f"{ui['probe']}.",
+                f"Captured {total} runs for probe {probe}.",
+            )
+        else:
+            logger.warning("Batch for probe %s ended with a failed last run.", probe)
+            page.show_info_bar(
+                "Batch Incomplete",
+                f"The last of {total} runs for probe {probe} was not "
+                f"saved. The batch has been ended.",
+                is_error=True,
             )
 
     # ------------------------------------------------------------------
     # Calculation
     # ------------------------------------------------------------------
 
-    def on_start_calc(self):
+    def on_start_calc(self) -> bool:
+        """
+        Validate the inputs and start a CalcWorker. Returns immediately,
+        True if a worker was started; the result is handled by
+        ``_on_calc_done``.
+        """
+        if self._calc_busy:
+            logger.info("Calculation already in progress; ignoring request.")
+            return False
         logger.info("Calculation started.")
-        self.measurement_page.set_result_text("Calculating...")
-        QApplication.processEvents()
-
         ui = self.measurement_page.get_measurement_data()
 
+        # Validate before touching the result label, so a rejected click
+        # repaints it once ("Error") rather than twice.
+
         if ui["ref_capture"] is None or ui["mat_capture"] is None:
             self._fail("Validation Error",
                        "Please capture both reference and sample images first.")
-            return
-        if not ui["material_path"]:
-            self._fail("Validation Error", "No material selected."); return
+            return False
+        # material_path is derived from the same tuple, so one check covers both.
+        if ui["material"] is None:
+            self._fail("Validation Error", "No material selected."); return False
         if ui["wavelength_um"] is None:
-            self._fail("Validation Error", "No wavelength selected."); return
-
-        try:
-            shelf, book, page = ui["material_path"].split("/")
-        except ValueError:
-            self._fail("Internal Error", f"Invalid material path: {ui['material_path']}"); return
+            self._fail("Validation Error", "No wavelength selected."); return False
+        shelf, book, page = ui["material"]
 
         ref_capture: FrameCaptureResult = ui["ref_capture"]
         mat_capture: FrameCaptureResult = ui["mat_capture"]
@@ -402,18 +671,48 @@ class MainController:
             ui["reference_thickness_nm"], ui["session_tag"],
         )
 
-        try:
-            thickness_nm, error_msg, capture_stats = (
-                self.calculation_service.calculate_thickness_from_captures(
-                    ref_capture, mat_capture, shelf, book, page, ui["wavelength_um"]
-                )
-            )
-        except Exception as e:
-            logger.exception("UNHANDLED EXCEPTION in calculation: %s", e)
-            self._fail("Unhandled Error", str(e)); return
+        self.measurement_page.set_result_text("Calculating...")
+        # Disabled while the worker runs so a second click can't queue a
+        # duplicate calculation; re-enabled on failure.
+        self.measurement_page.set_calculation_enabled(False)
+        self.measurement_page.set_calculation_busy(True)
+        self._calc_busy = True
+
+        worker = CalcWorker(
+            self.calculation_service, ref_capture, mat_capture,
+            shelf, book, page, ui["wavelength_um"],
+        )
+        worker.signals.done.connect(partial(
+            self._on_calc_done, ui=ui, shelf=shelf, book=book, page=page,
+        ))
+        worker.signals.failed.connect(self._on_calc_failed)
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _on_calc_failed(self, message: str):
+        self._fail("Unhandled Error", message)
+        self.measurement_page.set_calculation_busy(False)
+        self.measurement_page.set_calculation_enabled(True)
+        self._on_calc_settled(ok=False)
 
+    def _on_calc_done(
+        self,
+        thickness_nm:  float | None,
+        error_msg:     str | None,
+        capture_stats: dict[str, Any],
+        *,
+        ui:    dict[str, Any],
+        shelf: str, book: str, page: str,
+    ):
+        self.measurement_page.set_calculation_busy(False)
         if error_msg:
-            self._fail("Calculation Error", error_msg); return
+            self._fail("Calculation Error", error_msg)
+            self.measurement_page.set_calculation_enabled(True)
+            self._on_calc_settled(ok=False)
+            return
+
+        ref_capture: FrameCaptureResult = ui["ref_capture"]
+        mat_capture: FrameCaptureResult = ui["mat_capture"]
 
         mode = capture_stats.get("Mode", "single")
         corrected_nm = self._apply_active_calibration(
@@ -426,26 +725,29 @@ class MainController:
             capture_stats["ThicknessCorrected"] = round(corrected_nm, 4)
 
         result_html = self._format_result_html(thickness_nm, corrected_nm)
-        self.measurement_page.set_result_text(result_html)
         logger.info(
             "Calculation successful: raw=%.4f nm, corrected=%s",
             thickness_nm,
             f"{corrected_nm:.4f} nm" if corrected_nm is not None else "-",
         )
 
-        if ui["save_checked"]:
-            self._save_measurement_to_db(
-                thickness       = thickness_nm,
-                wavelength      = ui["wavelength_um"],
-                ref_image       = ref_capture.image,
-                mat_image       = mat_capture.image,
-                shelf=shelf, book=book, page=page,
-                ui_data         = ui,
-                capture_stats   = capture_stats,
-            )
-            self.measurement_page.set_result_text(result_html, append=True)
+        if not ui["save_checked"]:
+            self.measurement_page.set_result_text(result_html)
+            self._on_calc_settled(ok=True)
+            return
 
-        self.measurement_page.set_calculation_enabled(False)
+        # The label is written once the save settles, with or without
+        # the "Saved!" suffix, instead of once now and again on success.
+        self._save_measurement_to_db(
+            result_html     = result_html,
+            thickness       = thickness_nm,
+            wavelength      = ui["wavelength_um"],
+            ref_image       = ref_capture.image,
+            mat_image       = mat_capture.image,
+            shelf=shelf, book=book, page=page,
+            ui_data         = ui,
+            capture_stats   = capture_stats,
+        )
 
     # ------------------------------------------------------------------
     # Calibration helpers
@@ -505,6 +807,7 @@ class MainController:
 
     def _save_measurement_to_db(
         self,
+        result_html:   str,
         thickness:     float,
         wavelength:    float,
         ref_image,
@@ -515,82 +818,87 @@ class MainController:
         ui_data:       dict[str, Any],
         capture_stats: dict[str, Any],
     ):
+        """
+        Build the DB row on the UI thread and hand the image encoding and
+        INSERT to a SaveWorker. Completion is reported back through
+        ``_on_save_finished`` / ``_on_save_error``, which also write
+        ``result_html`` to the result label.
+        """
         logger.info("Saving measurement to database.")
-        try:
-            name = ui_data["name"] if (ui_data["use_name"] and ui_data["name"]) else "Guest"
-            note = ui_data["note"] or None
-
-            ref_img_name = f"ref_{uuid.uuid4()}.png"
-            mat_img_name = f"mat_{uuid.uuid4()}.png"
-
-            image_dir = self.db_service.image_dir_path
-            cv2.imwrite(str(image_dir / ref_img_name), ref_image)
-            cv2.imwrite(str(image_dir / mat_img_name), mat_image)
-
-            db_data: dict[str, Any] = {
-                "Name":       name,
-                "Layer":      thickness,
-                "Wavelength": wavelength,
-                "RefImage":   ref_img_name,
-                "MatImage":   mat_img_name,
-                "Shelf":      shelf,
-                "Book":       book,
-                "Page":       page,
-                "Note":       note,
-            }
-            db_data.update(capture_stats)
-
-            if ui_data.get("reference_thickness_nm") is not None:
-                db_data["ReferenceThickness"] = float(ui_data["reference_thickness_nm"])
-            if ui_data.get("session_tag"):
-                db_data["SessionTag"] = str(ui_data["session_tag"])
-            if ui_data.get("probe"):
-                db_data["Probe"] = str(ui_data["probe"])
-            if ui_data.get("run_index") is not None:
-                db_data["RunIndex"] = int(ui_data["run_index"])
-
-            row_id = self.db_service.save_measurement(db_data)
-            if row_id <= 0:
-                raise RuntimeError("DatabaseService.save_measurement returned -1")
-
-            logger.info("Measurement saved with ID %s.", row_id)
-            self.measurement_page.show_info_bar(
-                "Success", f"Measurement saved (ID {row_id}).",
-            )
+        name = ui_data["name"] if (ui_data["use_name"] and ui_data["name"]) else "Guest"
+        note = ui_data["note"] or None
+
+        db_data: dict[str, Any] = {
+            "Name":       name,
+            "Layer":      thickness,
+            "Wavelength": wavelength,
+            "Shelf":      shelf,
+            "Book":       book,
+            "Page":       page,
+            "Note":       note,
+        }
+        db_data.update(capture_stats)
+
+        if ui_data.get("reference_thickness_nm") is not None:
+            db_data["ReferenceThickness"] = float(ui_data["reference_thickness_nm"])
+        if ui_data.get("session_tag"):
+            db_data["SessionTag"] = str(ui_data["session_tag"])
+        if ui_data.get("probe"):
+            db_data["Probe"] = str(ui_data["probe"])
+        if ui_data.get("run_index") is not None:
+            db_data["RunIndex"] = int(ui_data["run_index"])
+
+        worker = SaveWorker(
+            self.db_service, db_data, ref_image, mat_image, self._image_dir,
+        )
+        worker.signals.finished.connect(partial(self._on_save_finished, result_html))
+        worker.signals.error.connect(partial(self._on_save_error, result_html))
+        QThreadPool.globalInstance().start(worker)
 
-            # Always refresh dependent views after a successful save so
-            # filters, suggestions and tables pick up the new row without
-            # the user having to re-navigate.
-            try:
-                self.calibration_page.refresh_data()
-            except Exception as e:
-                logger.debug("Calibration refresh after save failed: %s", e)
-            try:
-                self.validation_page.refresh_data()
-            except Exception as e:
-                logger.debug("Validation refresh after save failed: %s", e)
-            try:
-                self.history_page.refresh_data()
-            except Exception as e:
-                logger.debug("History refresh after save failed: %s", e)
-            try:
-                self.view.csv_interface._load_filter_suggestions()
-                self.view.csv_interface.on_update_count()
-            except Exception as e:
-                logger.debug("CSV refresh after save failed: %s", e)
+    def _on_save_finished(self, result_html: str, row_id: int):
+        logger.info("Measurement saved with ID %s.", row_id)
+        self.measurement_page.set_result_text(f"{result_html}<br>Saved!")
+        self.measurement_page.show_info_bar(
+            "Success", f"Measurement saved (ID {row_id}).",
+        )
+        self._on_calc_settled(ok=True)
 
+        # Always refresh dependent views after a successful save so
+        # filters, suggestions and tables pick up the new row without
+        # the user having to re-navigate.
+        try:
+            self.calibration_page.refresh_data()
         except Exception as e:
-            logger.exception("Failed to save measurement: %s", e)
-            self.measurement_page.show_info_bar(
-                "Save Error", "Failed to save measurement.", is_error=True,
-            )
+            logger.debug("Calibration refresh after save failed: %s", e)
+        try:
+            self.validation_page.refresh_data()
+        except Exception as e:
+            logger.debug("Validation refresh after save failed: %s", e)
+        try:
+            self.history_page.refresh_data()
+        except Exception as e:
+            logger.debug("History refresh after save failed: %s", e)
+        try:
+            self.view.csv_interface._load_filter_suggestions()
+            self.view.csv_interface.on_update_count()
+        except Exception as e:
+            logger.debug("CSV refresh after save failed: %s", e)
+
+    def _on_save_error(self, result_html: str, message: str):
+        self.measurement_page.set_result_text(result_html)
+        self.measurement_page.show_info_bar(
+            "Save Error", "Failed to save measurement.", is_error=True,
+        )
+        self._on_calc_settled(ok=False)
 
     # ------------------------------------------------------------------
     # Small helpers
     # ------------------------------------------------------------------
 
     def _require_camera_connected(self) -> bool:
-        if self.camera_service.get_status()["connected"]:
+        # is_connected is maintained by connect()/disconnect(); reading it
+        # avoids building the full get_status() dict on every click.
+        if self.camera_service.is_connected:
             return True
         logger.error("Capture requested but camera is not connected.")
         self.measurement_page.show_info_bar(
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, Qt
 from qfluentwidgets import FluentWindow, FluentIcon
 
 from layer_thickness_app.config.config                import AppConfig
@@ -78,19 +78,28 @@ class MainWindow(FluentWindow):
         self.addSubInterface(self.help_interface,     FluentIcon.HELP,    "Help",     position=1)
         self.addSubInterface(self.settings_interface, FluentIcon.SETTING, "Settings", position=1)
 
+        self.stackedWidget.currentChanged.connect(self._on_page_changed)
+
         # Config signals
         self.config.window_size_changed.connect(self.apply_window_size)
         self.apply_window_size(self.config.window_size)
 
+    def _on_page_changed(self, index: int):
+        if self.stackedWidget.widget(index) is not self.help_interface:
+            self.help_interface.release_video()
+
     def apply_window_size(self, size_str: str):
         max_size = QSize(16777215, 16777215)
         self.setMaximumSize(max_size)
         self.setMinimumSize(0, 0)
-        self.showNormal()
-
+        # setWindowState instead of showNormal()/showFullScreen(): those
+        # also show() the window, which during __init__ mapped it (and
+        # laid out every page) behind the splash before show_window().
+        # On a hidden window the state simply applies at the first show.
         if size_str == "Fullscreen":
-            self.showFullScreen()
+            self.setWindowState(Qt.WindowState.WindowFullScreen)
             return
+        self.setWindowState(Qt.WindowState.WindowNoState)
 
         if "x" in size_str:
             try:
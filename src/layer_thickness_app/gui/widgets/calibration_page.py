@@ -352,35 +352,48 @@ class CalibrationPage(QWidget):
     def _populate_table(self, rows: list[dict[str, Any]]) -> None:
         self.table.setUpdatesEnabled(False)
         try:
-            self.table.clearContents()
+            # Rows that already exist keep their items and role combo and
+            # only get new text, so reloading candidates doesn't recreate
+            # every cell. setRowCount drops any surplus rows.
             self.table.setRowCount(len(rows))
 
             for i, r in enumerate(rows):
-                def _item(text: str, align_center: bool = True) -> QTableWidgetItem:
-                    it = QTableWidgetItem(text)
-                    if align_center:
-                        it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    return it
-
                 layer = r.get("Layer")
                 ref   = r.get("ReferenceThickness")
                 # The DB stores per-side counts; sample frames are what matter
                 # for calibration noise.
                 frames = r.get("FrameCountSample") or r.get("FrameCountRef")
 
-                self.table.setItem(i, _COL_ID,      _item(str(r.get("id", ""))))
-                self.table.setItem(i, _COL_DATE,    _item(str(r.get("Date", ""))[:19]))
-                self.table.setItem(i, _COL_REF,     _item(f"{ref:g}"     if ref   is not None else "—"))
-                self.table.setItem(i, _COL_LAYER,   _item(f"{layer:.3f}" if layer is not None else "—"))
-                self.table.setItem(i, _COL_MODE,    _item(str(r.get("Mode", ""))))
-                self.table.setItem(i, _COL_FRAMES,  _item(str(frames) if frames is not None else ""))
-                self.table.setItem(i, _COL_SESSION, _item(str(r.get("SessionTag") or "")))
-
-                combo = QComboBox()
-                combo.addItems(_ASSIGN_OPTIONS)
-                combo.setCurrentText(ASSIGN_IGNORE)
-                combo.currentTextChanged.connect(self._update_counts_label)
-                self.table.setCellWidget(i, _COL_ASSIGN, combo)
+                cells = (
+                    (_COL_ID,      str(r.get("id", ""))),
+                    (_COL_DATE,    str(r.get("Date", ""))[:19]),
+                    (_COL_REF,     f"{ref:g}"     if ref   is not None else "—"),
+                    (_COL_LAYER,   f"{layer:.3f}" if layer is not None else "—"),
+                    (_COL_MODE,    str(r.get("Mode", ""))),
+                    (_COL_FRAMES,  str(frames) if frames is not None else ""),
+                    (_COL_SESSION, str(r.get("SessionTag") or "")),
+                )
+                for col, text in cells:
+                    item = self.table.item(i, col)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self.table.setItem(i, col, item)
+                    else:
+                        item.setText(text)
+
+                combo = self.table.cellWidget(i, _COL_ASSIGN)
+                if isinstance(combo, QComboBox):
+                    # Counts are refreshed once by the caller.
+                    combo.blockSignals(True)
+                    combo.setCurrentText(ASSIGN_IGNORE)
+                    combo.blockSignals(False)
+                else:
+                    combo = QComboBox()
+                    combo.addItems(_ASSIGN_OPTIONS)
+                    combo.setCurrentText(ASSIGN_IGNORE)
+                    combo.currentTextChanged.connect(self._update_counts_label)
+                    self.table.setCellWidget(i, _COL_ASSIGN, combo)
         finally:
             self.table.setUpdatesEnabled(True)
 
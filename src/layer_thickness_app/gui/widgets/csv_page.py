@@ -5,35 +5,187 @@ selection and a one-click ZIP import that re-populates the database.
 
 from __future__ import annotations
 
+import bisect
 import logging
+import time
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QDate, QObject, QRunnable, QSignalBlocker, QStringListModel,
+    QThreadPool, QTimer, pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QFrame, QFormLayout,
+    QCompleter,
 )
 from qfluentwidgets import (
-    BodyLabel, SubtitleLabel, ComboBox, DatePicker,
+    BodyLabel, SubtitleLabel, ComboBox, EditableComboBox, DatePicker,
     PrimaryPushButton, PushButton, InfoBar, InfoBarPosition,
 )
 
 from layer_thickness_app.services.database_service import DatabaseService
 from layer_thickness_app.services.import_service   import ImportService
 from layer_thickness_app.services.export_service   import ExportService
-from layer_thickness_app.gui.theme import card_style, borderless_style
+from layer_thickness_app.gui.theme import (
+    COLOR_ERROR, card_style, borderless_style,
+)
 
 logger = logging.getLogger(__name__)
 
 _EXPORT_CARD_OBJECT_NAME = "csv_export_card"
 _IMPORT_CARD_OBJECT_NAME = "csv_import_card"
 
+# Initial folder for the file dialogs, resolved once per process.
+_HOME = str(Path.home())
+
+
+class _CountWorkerSignals(QObject):
+    """Signals emitted by _CountWorker."""
+
+    done = pyqtSignal(int, int)   # count generation, count (-1 on error)
+
+
+class _CountWorker(QRunnable):
+    """
+    Runs ``get_measurements_count`` on a QThreadPool thread so a slow
+    COUNT over a large table does not stall typing and date picking.
+    """
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        generation: int,
+        filters:    dict[str, Any],
+    ):
+        super().__init__()
+        self.db_service = db_service
+        self.generation = generation
+        self.filters    = filters
+        self.signals    = _CountWorkerSignals()
+
+    def run(self):
+        try:
+            count = self.db_service.get_measurements_count(**self.filters)
+        except Exception as e:
+            logger.error("Counting export rows failed: %s", e)
+            count = -1
+        self.signals.done.emit(self.generation, count)
+
+
+class _NameLookupWorkerSignals(QObject):
+    """Signals emitted by _NameLookupWorker."""
+
+    done = pyqtSignal(int, object)   # lookup generation, list[str]
+
+
+class _NameLookupWorker(QRunnable):
+    """
+    Runs the ``get_names_matching`` prefix lookup on a QThreadPool
+    thread so the LIKE scan does not block keystrokes.
+    """
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        generation: int,
+        prefix:     str,
+        limit:      int,
+    ):
+        super().__init__()
+        self.db_service = db_service
+        self.generation = generation
+        self.prefix     = prefix
+        self.limit      = limit
+        self.signals    = _NameLookupWorkerSignals()
+
+    def run(self):
+        try:
+            names = self.db_service.get_names_matching(self.prefix, self.limit)
+        except Exception as e:
+            logger.error("Name lookup for %r failed: %s", self.prefix, e)
+            names = []
+        self.signals.done.emit(self.generation, names)
+
+
+class _SuggestionsWorkerSignals(QObject):
+    """Signals emitted by _SuggestionsWorker."""
+
+    done = pyqtSignal(int, object)   # data version, dict[str, list[str]]
+
+
+class _SuggestionsWorker(QRunnable):
+    """
+    Fetches the distinct shelf/book/page values for the filter combos
+    on a QThreadPool thread, in one query.
+    """
+
+    def __init__(self, db_service: DatabaseService, version: int):
+        super().__init__()
+        self.db_service = db_service
+        self.version    = version
+        self.signals    = _SuggestionsWorkerSignals()
+
+    def run(self):
+        try:
+            suggestions = self.db_service.get_unique_filter_values()
+        except Exception as e:
+            logger.error("Loading filter suggestions failed: %s", e)
+            suggestions = {"shelf": [], "book": [], "page": []}
+        self.signals.done.emit(self.version, suggestions)
+
+
+class _ImportWorkerSignals(QObject):
+    """Signals emitted by _ImportWorker."""
+
+    progress = pyqtSignal(int, int)   # rows imported, rows failed so far
+    finished = pyqtSignal(int, int, object)   # success_count, fail_count, values
+    error    = pyqtSignal(str)
+
+
+class _ImportWorker(QRunnable):
+    """
+    Runs ``ImportService.import_from_zip`` on a QThreadPool thread; a
+    multi-MB archive otherwise froze the window for the whole import.
+    """
+
+    def __init__(self, import_service: ImportService, filepath: str):
+        super().__init__()
+        self.import_service = import_service
+        self.filepath       = filepath
+        self.signals        = _ImportWorkerSignals()
+
+    def run(self):
+        try:
+            success_count, fail_count, values = self.import_service.import_from_zip(
+                self.filepath, progress=self.signals.progress.emit,
+            )
+        except Exception as e:
+            logger.exception("Error during import: %s", e)
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(success_count, fail_count, values)
+
 
 class CSVPage(QWidget):
     """Import and export page with filter selection."""
 
     data_changed = pyqtSignal()
 
+    # Filter edits arriving within this window share one COUNT query.
+    COUNT_DEBOUNCE_MS = 150
+
+    # Names offered by the type-ahead completer per lookup.
+    NAME_COMPLETION_LIMIT = 50
+
+    # Keystrokes within this window share one name lookup.
+    NAME_LOOKUP_DEBOUNCE_MS = 100
+
+    # A repeat of the same info bar within this window is dropped.
+    INFO_DEDUPE_S = 1.0
+
     def __init__(
         self,
         db_service:     DatabaseService,
@@ -46,18 +198,60 @@ class CSVPage(QWidget):
         self.import_service = import_service
         self.export_service = export_service
 
-        # Suppress info bars during the initial population.
-        self._is_loading = True
+        # COUNT results per filter combination and the suggestion lists
+        # shown in the combos. Both are valid for one DB data_version;
+        # every reload request (save, import, history edits/deletes)
+        # checks it and only re-queries when the data actually changed.
+        self._count_cache: dict[tuple, int] = {}
+        self._suggestions_version = -1
+        self._cached_suggestions: dict[str, list[str]] = {}
+
+        # COUNT bookkeeping: keys with a query already running (a repeat
+        # request joins it instead of starting another), the key the
+        # label should show, and a generation bumped whenever the data
+        # changes so results computed before that are not cached.
+        self._count_inflight: set[tuple] = set()
+        self._count_wanted_key: tuple = ()
+        self._count_generation = 0
+
+        # Bumped for every name lookup, so only the newest result fills
+        # the completer.
+        self._name_generation = 0
+
+        # The info bar on screen (None once it closed) and the last
+        # message shown, for dropping rapid repeats.
+        self._current_info_bar: InfoBar | None = None
+        self._last_info:      tuple = ()
+        self._last_info_time: float = 0.0
+
+        # Raw widget state behind the last filter dict handed out, so an
+        # unchanged form skips the date formatting and dict rebuild.
+        self._last_filter_state: tuple = ()
+        self._last_filter_dict:  dict[str, Any] = {}
+
+        # Folders the dialogs reopen in; each remembers the last choice.
+        self._last_export_dir = _HOME
+        self._last_import_dir = _HOME
 
         self.setObjectName("csv_page")
 
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(self.COUNT_DEBOUNCE_MS)
+        self._count_timer.timeout.connect(self.on_update_count)
+
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(self.NAME_LOOKUP_DEBOUNCE_MS)
+        self._name_timer.timeout.connect(self._refresh_name_completions)
+
         self._init_widgets()
         self._init_layout()
         self._connect_signals()
+        self._refresh_date_strings()
         self._load_filter_suggestions()
 
         self.on_update_count()
-        self._is_loading = False
 
     # ------------------------------------------------------------------
     # Widget construction
@@ -67,8 +261,15 @@ class CSVPage(QWidget):
         self.filter_title = SubtitleLabel("Export Filters")
         self.import_title = SubtitleLabel("Import")
 
-        self.name_filter = ComboBox(self)
+        # Names grow with every measurement, so they are not preloaded;
+        # the completer asks the DB for the first few matches instead.
+        self.name_filter = EditableComboBox(self)
         self.name_filter.setPlaceholderText("Filter by name...")
+        self._name_model = QStringListModel(self)
+        self._name_completer = QCompleter(self._name_model, self)
+        self._name_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._name_completer.setMaxVisibleItems(10)
+        self.name_filter.setCompleter(self._name_completer)
 
         self.start_date_filter = DatePicker(self)
         self.start_date_filter.setDate(QDate(2024, 1, 1))
@@ -85,6 +286,11 @@ class CSVPage(QWidget):
         self.page_filter = ComboBox(self)
         self.page_filter.setPlaceholderText("Filter by page...")
 
+        self._filter_widgets = (
+            self.name_filter, self.start_date_filter, self.end_date_filter,
+            self.shelf_filter, self.book_filter, self.page_filter,
+        )
+
         self.count_label = BodyLabel("Items to export: 0")
 
         self.reset_filters_button = PushButton("Reset Filters")
@@ -133,6 +339,7 @@ class CSVPage(QWidget):
 
         export_layout.addLayout(filter_form_layout)
 
+        self._count_label_alert = False
         self.count_label.setStyleSheet(f"{borderless_style()} font-weight: bold;")
         count_layout = QHBoxLayout()
         count_layout.addWidget(self.count_label, 1, Qt.AlignmentFlag.AlignLeft)
@@ -175,60 +382,168 @@ class CSVPage(QWidget):
         self.reset_filters_button.clicked.connect(self.on_reset_filters)
         self.export_button.clicked.connect(self.on_export)
         self.import_button.clicked.connect(self.on_import)
-
-        self.name_filter.currentTextChanged.connect(self.on_update_count)
-        self.start_date_filter.dateChanged.connect(self.on_update_count)
-        self.end_date_filter.dateChanged.connect(self.on_update_count)
-        self.shelf_filter.currentTextChanged.connect(self.on_update_count)
-        self.book_filter.currentTextChanged.connect(self.on_update_count)
-        self.page_filter.currentTextChanged.connect(self.on_update_count)
+        self.name_filter.textEdited.connect(self._name_timer.start)
+        # Picking a completion sets the text without a user edit.
+        self._name_completer.activated.connect(self._count_timer.start)
+        self.start_date_filter.dateChanged.connect(self._refresh_date_strings)
+        self.end_date_filter.dateChanged.connect(self._refresh_date_strings)
+
+        # Filter edits restart the debounce timer instead of querying
+        # directly, so a burst of changes costs a single COUNT.
+        schedule = self._count_timer.start
+        self.name_filter.currentTextChanged.connect(schedule)
+        self.start_date_filter.dateChanged.connect(schedule)
+        self.end_date_filter.dateChanged.connect(schedule)
+        self.shelf_filter.currentTextChanged.connect(schedule)
+        self.book_filter.currentTextChanged.connect(schedule)
+        self.page_filter.currentTextChanged.connect(schedule)
+
+    @contextmanager
+    def _bulk_filter_edit(self, recount: bool = True):
+        """
+        Silences and freezes all filter widgets for a batch of changes,
+        then schedules a single COUNT (unless ``recount`` is False).
+        """
+        with ExitStack() as blockers:
+            for widget in self._filter_widgets:
+                # Restores each widget's previous blocked state on exit,
+                # also when the body raises.
+                blockers.enter_context(QSignalBlocker(widget))
+                widget.setUpdatesEnabled(False)
+            try:
+                yield
+            finally:
+                for widget in self._filter_widgets:
+                    widget.setUpdatesEnabled(True)
+        # dateChanged was blocked above.
+        self._refresh_date_strings()
+        if recount:
+            self._count_timer.start()
 
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
 
     def _load_filter_suggestions(self):
-        """Repopulates the filter combos from the database."""
-        for combo in (self.name_filter, self.shelf_filter,
-                      self.book_filter, self.page_filter):
-            combo.blockSignals(True)
-
-        self.name_filter.clear()
-        self.name_filter.addItems(self.db_service.get_unique_names())
-        self.name_filter.setCurrentIndex(-1)
+        """
+        Refreshes the filter combos from the database in the background.
+        Returns early when nothing was written since the last load.
+        """
+        version = self.db_service.data_version
+        if version == self._suggestions_version:
+            return
+        self._suggestions_version = version
+        self._invalidate_counts()
 
-        self.shelf_filter.clear()
-        self.shelf_filter.addItems(self.db_service.get_unique_shelves())
-        self.shelf_filter.setCurrentIndex(-1)
+        worker = _SuggestionsWorker(self.db_service, version)
+        worker.signals.done.connect(self._on_suggestions_loaded)
+        QThreadPool.globalInstance().start(worker)
 
-        self.book_filter.clear()
-        self.book_filter.addItems(self.db_service.get_unique_books())
-        self.book_filter.setCurrentIndex(-1)
+    def _on_suggestions_loaded(self, version: int, suggestions: dict[str, list[str]]):
+        if version != self._suggestions_version:
+            return   # a newer load is already on its way
 
-        self.page_filter.clear()
-        self.page_filter.addItems(self.db_service.get_unique_pages())
-        self.page_filter.setCurrentIndex(-1)
+        combos = (
+            ("shelf", self.shelf_filter),
+            ("book",  self.book_filter),
+            ("page",  self.page_filter),
+        )
+        changed = [
+            (key, combo) for key, combo in combos
+            if suggestions[key] != self._cached_suggestions.get(key, [])
+        ]
+        # Refilling clears the selection, so recount only if a combo was
+        # actually touched. Updates stay frozen so each refilled combo
+        # repaints once, not once per item.
+        with self._bulk_filter_edit(recount=bool(changed)):
+            for key, combo in changed:
+                items = suggestions[key]
+                self._cached_suggestions[key] = items
+                combo.clear()
+                combo.addItems(items)
+                combo.setCurrentIndex(-1)
+
+    def _merge_filter_suggestions(self, values: dict[str, set[str]]):
+        """
+        Adds newly seen shelf/book/page values to the combos in sorted
+        position, without re-querying or refilling them. The current
+        selections are kept.
+        """
+        # Rows were added, so every memoized count may be stale.
+        self._invalidate_counts()
+
+        combos = (
+            ("shelf", self.shelf_filter),
+            ("book",  self.book_filter),
+            ("page",  self.page_filter),
+        )
+        with self._bulk_filter_edit(recount=False):
+            for key, combo in combos:
+                known = self._cached_suggestions.setdefault(key, [])
+                for text in sorted(values.get(key, set()).difference(known)):
+                    index = bisect.bisect(known, text)
+                    known.insert(index, text)
+                    combo.insertItem(index, text)
+
+    def _refresh_name_completions(self):
+        self._name_generation += 1
+        text = self.name_filter.text()
+        if not text:
+            self._name_model.setStringList([])
+            return
 
-        for combo in (self.name_filter, self.shelf_filter,
-                      self.book_filter, self.page_filter):
-            combo.blockSignals(False)
+        worker = _NameLookupWorker(
+            self.db_service, self._name_generation,
+            text, self.NAME_COMPLETION_LIMIT,
+        )
+        worker.signals.done.connect(self._on_names_ready)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_names_ready(self, generation: int, names: list[str]):
+        if generation != self._name_generation:
+            return   # the text changed while this lookup ran
+        self._name_model.setStringList(names)
+        # The line edit already popped its menu over the previous matches;
+        # show it again over the fresh ones.
+        if names and self.name_filter.hasFocus():
+            self._name_completer.complete()
+
+    def _refresh_date_strings(self, *_):
+        """
+        Formats the picker dates once per change rather than on every
+        filter read.
+        """
+        start = self.start_date_filter.date
+        end   = self.end_date_filter.date
+        self._start_date_str = start.toString("yyyy-MM-dd") if start.isValid() else None
+        self._end_date_str   = end.toString("yyyy-MM-dd")   if end.isValid()   else None
 
     def _get_current_filters(self) -> dict[str, Any]:
+        """
+        Returns the export filters for the current form. The dict is
+        shared between calls while the form is unchanged; don't mutate it.
+        """
         name  = self.name_filter.currentText()
-        start = self.start_date_filter.date
-        end   = self.end_date_filter.date
+        start = self._start_date_str
+        end   = self._end_date_str
         shelf = self.shelf_filter.currentText()
         book  = self.book_filter.currentText()
         page  = self.page_filter.currentText()
 
-        return {
+        state = (name, start, end, shelf, book, page)
+        if state == self._last_filter_state:
+            return self._last_filter_dict
+
+        self._last_filter_state = state
+        self._last_filter_dict  = {
             "name_filter": name if name else None,
-            "start_date":  start.toString("yyyy-MM-dd") if start.isValid() else None,
-            "end_date":    end.toString("yyyy-MM-dd")   if end.isValid()   else None,
+            "start_date":  start,
+            "end_date":    end,
             "shelf":       shelf if shelf else None,
             "book":        book  if book  else None,
             "page":        page  if page  else None,
         }
+        return self._last_filter_dict
 
     # ------------------------------------------------------------------
     # Actions
@@ -236,46 +551,79 @@ class CSVPage(QWidget):
 
     def on_update_count(self):
         filters = self._get_current_filters()
-        count = self.db_service.get_measurements_count(**filters)
+        key = tuple(filters.items())
 
-        self.count_label.setText(f"Items to export: {count}")
-        self.export_button.setEnabled(count > 0)
+        # Whatever was requested before, the label now tracks this key.
+        self._count_wanted_key = key
+        count = self._count_cache.get(key)
+        if count is not None:
+            self._apply_count(count)
+            return
+        if key in self._count_inflight:
+            return   # the running query for this key will update the label
 
-        if count == 0 and not self._is_loading:
-            self._show_info_bar(
-                "No Matches",
-                "No measurements match the current filters.",
-                is_error=True,
+        self._count_inflight.add(key)
+        worker = _CountWorker(self.db_service, self._count_generation, filters)
+        worker.signals.done.connect(
+            partial(self._on_count_ready, key)
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_count_ready(self, key: tuple, generation: int, count: int):
+        if generation != self._count_generation:
+            return   # counted against data that has changed since
+        self._count_inflight.discard(key)
+        # Cached even if the filters have moved on; going back is free.
+        # Failures aren't, so the next edit tries again.
+        if count >= 0:
+            self._count_cache[key] = count
+        if key == self._count_wanted_key:
+            self._apply_count(count)
+
+    def _invalidate_counts(self):
+        self._count_generation += 1
+        self._count_cache.clear()
+        self._count_inflight.clear()
+
+    def _apply_count(self, count: int):
+        """Shows ``count``; a negative count means the query failed."""
+        # An in-place hint instead of an info bar: this runs for every
+        # filter edit, and typing often passes through zero matches.
+        empty  = count == 0
+        failed = count < 0
+        if failed:
+            text = "Items to export: unknown (count failed)"
+        elif empty:
+            text = "Items to export: 0 (no matches)"
+        else:
+            text = f"Items to export: {count}"
+        self.count_label.setText(text)
+        highlight = empty or failed
+        if highlight != self._count_label_alert:
+            self._count_label_alert = highlight
+            color = f" color: {COLOR_ERROR};" if highlight else ""
+            self.count_label.setStyleSheet(
+                f"{borderless_style()} font-weight: bold;{color}"
             )
+        # A failed count says nothing about the data; leave export usable.
+        self.export_button.setEnabled(not empty)
 
     def on_reset_filters(self):
-        for w in (
-            self.name_filter, self.start_date_filter, self.end_date_filter,
-            self.shelf_filter, self.book_filter, self.page_filter,
-        ):
-            w.blockSignals(True)
-
-        self.name_filter.setCurrentIndex(-1)
-        self.start_date_filter.setDate(QDate(2024, 1, 1))
-        self.end_date_filter.setDate(QDate(2030, 12, 31))
-        self.shelf_filter.setCurrentIndex(-1)
-        self.book_filter.setCurrentIndex(-1)
-        self.page_filter.setCurrentIndex(-1)
-
-        for w in (
-            self.name_filter, self.start_date_filter, self.end_date_filter,
-            self.shelf_filter, self.book_filter, self.page_filter,
-        ):
-            w.blockSignals(False)
-
-        self.on_update_count()
+        with self._bulk_filter_edit():
+            self.name_filter.setText("")
+            self.start_date_filter.setDate(QDate(2024, 1, 1))
+            self.end_date_filter.setDate(QDate(2030, 12, 31))
+            self.shelf_filter.setCurrentIndex(-1)
+            self.book_filter.setCurrentIndex(-1)
+            self.page_filter.setCurrentIndex(-1)
 
     def on_export(self):
         export_dir = QFileDialog.getExistingDirectory(
-            self, "Select Export Folder", str(Path.home()),
+            self, "Select Export Folder", self._last_export_dir,
         )
         if not export_dir:
             return
+        self._last_export_dir = export_dir
 
         try:
             filters = self._get_current_filters()
@@ -301,60 +649,97 @@ class CSVPage(QWidget):
 
     def on_import(self):
         filepath, _ = QFileDialog.getOpenFileName(
-            self, "Select ZIP File to Import", str(Path.home()),
+            self, "Select ZIP File to Import", self._last_import_dir,
             "ZIP Files (*.zip)",
         )
         if not filepath:
             return
+        self._last_import_dir = str(Path(filepath).parent)
 
-        try:
-            success_count, fail_count = self.import_service.import_from_zip(filepath)
+        self.import_button.setEnabled(False)
+        self.import_button.setText("Importing...")
 
-            if success_count > 0 and fail_count == 0:
-                self._show_info_bar(
-                    "Import Successful",
-                    f"Successfully imported {success_count} rows.",
-                    is_error=False,
-                )
-            elif success_count > 0 and fail_count > 0:
-                self._show_info_bar(
-                    "Import Partially Successful",
-                    f"Imported {success_count} rows. {fail_count} rows failed.",
-                    is_error=True,
-                )
-            elif success_count == 0 and fail_count > 0:
-                self._show_info_bar(
-                    "Import Failed",
-                    f"All {fail_count} rows failed. Check log for details.",
-                    is_error=True,
-                )
-            else:
-                self._show_info_bar(
-                    "Import Warning",
-                    "No data was imported. The file might be empty, invalid or missing headers.",
-                    is_error=True,
-                )
+        worker = _ImportWorker(self.import_service, filepath)
+        worker.signals.progress.connect(self._on_import_progress)
+        worker.signals.finished.connect(self._on_import_finished)
+        worker.signals.error.connect(self._on_import_error)
+        QThreadPool.globalInstance().start(worker)
 
-            self._load_filter_suggestions()
-            self.on_update_count()
+    def _on_import_progress(self, success_count: int, fail_count: int):
+        self.import_button.setText(
+            f"Importing... ({success_count + fail_count} rows)"
+        )
 
-            if success_count > 0:
-                self.data_changed.emit()
+    def _end_import(self):
+        self.import_button.setText("Import from ZIP")
+        self.import_button.setEnabled(True)
 
-        except Exception as e:
-            logger.exception("Error during import: %s", e)
+    def _on_import_error(self, message: str):
+        self._end_import()
+        self._show_info_bar(
+            "Import Error", f"An unexpected error occurred: {message}", is_error=True,
+        )
+
+    def _on_import_finished(
+        self, success_count: int, fail_count: int, values: dict[str, set[str]],
+    ):
+        self._end_import()
+        if success_count > 0 and fail_count == 0:
+            self._show_info_bar(
+                "Import Successful",
+                f"Successfully imported {success_count} rows.",
+                is_error=False,
+            )
+        elif success_count > 0 and fail_count > 0:
             self._show_info_bar(
-                "Import Error", f"An unexpected error occurred: {e}", is_error=True,
+                "Import Partially Successful",
+                f"Imported {success_count} rows. {fail_count} rows failed.",
+                is_error=True,
+            )
+        elif success_count == 0 and fail_count > 0:
+            self._show_info_bar(
+                "Import Failed",
+                f"All {fail_count} rows failed. Check log for details.",
+                is_error=True,
+            )
+        else:
+            self._show_info_bar(
+                "Import Warning",
+                "No data was imported. The file might be empty, invalid or missing headers.",
+                is_error=True,
             )
 
+        if success_count > 0:
+            self._merge_filter_suggestions(values)
+            self.on_update_count()
+            self.data_changed.emit()
+
     def _show_info_bar(self, title: str, content: str, is_error: bool = False):
+        message = (title, content, is_error)
+        now     = time.monotonic()
+        if message == self._last_info and now - self._last_info_time < self.INFO_DEDUPE_S:
+            return
+        self._last_info      = message
+        self._last_info_time = now
+
+        # Replace rather than stack: only the newest message matters.
+        if self._current_info_bar is not None:
+            self._current_info_bar.close()
+
         if is_error:
-            InfoBar.error(
+            info_bar = InfoBar.error(
                 title=title, content=content, duration=5000,
                 parent=self, position=InfoBarPosition.TOP,
             )
         else:
-            InfoBar.success(
+            info_bar = InfoBar.success(
                 title=title, content=content, duration=3000,
                 parent=self, position=InfoBarPosition.TOP,
-            )
\ No newline at end of file
+            )
+        info_bar.closedSignal.connect(partial(self._on_info_bar_closed, info_bar))
+        self._current_info_bar = info_bar
+
+    def _on_info_bar_closed(self, info_bar: InfoBar):
+        # The bar deletes itself after closing; drop the handle with it.
+        if self._current_info_bar is info_bar:
+            self._current_info_bar = None
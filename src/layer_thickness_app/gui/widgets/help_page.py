@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QFrame,
     QSlider, QStyle,
 )
-from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtCore import Qt, QTimer, QUrl
 from PyQt6.QtGui import QFont
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
 from PyQt6.QtMultimediaWidgets import QVideoWidget
@@ -46,6 +46,14 @@ class ClickableSlider(QSlider):
 class HelpPage(QWidget):
     """Tutorial-video page with a media player or placeholder card."""
 
+    # While scrubbing, seek at most once per this interval. Every seek
+    # makes the decoder restart from the previous keyframe.
+    SEEK_THROTTLE_MS = 100
+
+    # positionChanged ticks far more often than the slider needs to move;
+    # the handle is only repositioned when playback enters a new slot.
+    POSITION_UPDATE_MS = 250
+
     def __init__(self):
         super().__init__()
         self.setObjectName("helpPage")
@@ -72,6 +80,55 @@ class HelpPage(QWidget):
         desc_label.setStyleSheet("font-size: 14px; margin-bottom: 20px;")
         layout.addWidget(desc_label)
 
+        # The file check and the media backend start-up wait until the
+        # page is first shown; many sessions never open the help page.
+        self._loading_label = QLabel("Loading tutorial...")
+        self._loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._loading_label, 1)
+        self._video_loaded   = False
+        self.media_player: QMediaPlayer | None = None   # set once loaded
+        self._video_url      = QUrl.fromLocalFile(str(VIDEO_PATH))
+        self._saved_position = 0
+        self._restore_pending = False   # seek once the reloaded source is ready
+
+    # ------------------------------------------------------------------
+    # Visibility
+    # ------------------------------------------------------------------
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._video_loaded:
+            self._video_loaded = True
+            # Deferred so the page paints its loading label first.
+            QTimer.singleShot(0, self._load_video)
+        elif self.media_player is not None and self.media_player.source().isEmpty():
+            # setSource loads asynchronously; a seek issued now would be
+            # dropped, so _media_status_changed applies it once loaded.
+            self._restore_pending = True
+            self.media_player.setSource(self._video_url)
+
+    def release_video(self):
+        """
+        Drops the source so the decoder pipeline and its buffers are
+        released while another page is shown; resumed in showEvent.
+        Called when navigation leaves this page, not on every hide, so
+        minimizing the window leaves playback alone.
+        """
+        if self.media_player is not None and not self.media_player.source().isEmpty():
+            self._saved_position = self.media_player.position()
+            self.media_player.pause()
+            self.media_player.setSource(QUrl())
+
+    def _media_status_changed(self, status: QMediaPlayer.MediaStatus):
+        if status == QMediaPlayer.MediaStatus.LoadedMedia and self._restore_pending:
+            self._restore_pending = False
+            self.media_player.setPosition(self._saved_position)
+
+    def _load_video(self):
+        layout = self.layout()
+        layout.removeWidget(self._loading_label)
+        self._loading_label.deleteLater()
+
         if VIDEO_PATH.exists():
             logger.info("Tutorial video found. Initializing video player.")
             self._setup_video_player(layout)
@@ -114,7 +171,7 @@ class HelpPage(QWidget):
         self._apply_default_audio_device()
         self.media_player.setAudioOutput(self.audio_output)
         self.media_player.setVideoOutput(self.video_widget)
-        self.media_player.setSource(QUrl.fromLocalFile(str(VIDEO_PATH)))
+        self.media_player.setSource(self._video_url)
 
         # Re-route audio when the OS default output device changes (e.g. user
         # plugs in headphones or switches device in Windows sound settings).
@@ -126,9 +183,18 @@ class HelpPage(QWidget):
         self.position_slider = ClickableSlider(Qt.Orientation.Horizontal)
         self.position_slider.setRange(0, 0)
         self.position_slider.sliderMoved.connect(self._set_position)
+        self.position_slider.sliderReleased.connect(self._flush_seek)
+
+        self._pending_position: int | None = None
+        self._last_position_slot = -1
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(self.SEEK_THROTTLE_MS)
+        self._seek_timer.timeout.connect(self._flush_seek)
 
         self.media_player.positionChanged.connect(self._position_changed)
         self.media_player.durationChanged.connect(self._duration_changed)
+        self.media_player.mediaStatusChanged.connect(self._media_status_changed)
 
         controls_layout = QHBoxLayout()
 
@@ -175,6 +241,14 @@ class HelpPage(QWidget):
     # ------------------------------------------------------------------
 
     def _position_changed(self, position: int):
+        # Don't fight the user's drag, and skip ticks within one slot.
+        if self.position_slider.isSliderDown():
+            return
+        slot = position // self.POSITION_UPDATE_MS
+        if slot == self._last_position_slot:
+            return
+        self._last_position_slot = slot
+
         self.position_slider.blockSignals(True)
         self.position_slider.setValue(position)
         self.position_slider.blockSignals(False)
@@ -183,7 +257,20 @@ class HelpPage(QWidget):
         self.position_slider.setRange(0, duration)
 
     def _set_position(self, position: int):
+        # Leading edge seeks at once, so a click jumps immediately; moves
+        # inside the throttle window only remember the latest position.
+        if self._seek_timer.isActive():
+            self._pending_position = position
+            return
         self.media_player.setPosition(position)
+        self._seek_timer.start()
+
+    def _flush_seek(self):
+        if self._pending_position is None:
+            return
+        self.media_player.setPosition(self._pending_position)
+        self._pending_position = None
+        self._seek_timer.start()
 
     def _set_volume(self, volume: int):
         self.audio_output.setVolume(volume / 100.0)
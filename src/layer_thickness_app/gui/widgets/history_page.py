@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Callable
 
-from PyQt6.QtCore    import Qt, QDate, pyqtSignal
+from PyQt6.QtCore    import (
+    Qt, QAbstractTableModel, QDate, QModelIndex, QObject, QRunnable,
+    QSignalBlocker, QThreadPool, QTimer, pyqtSignal,
+)
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QAbstractItemView, QHeaderView, QInputDialog, QMenu,
     QDialog, QFormLayout, QDialogButtonBox, QScrollArea,
 )
 from qfluentwidgets import (
     BodyLabel, CaptionLabel, ComboBox, DatePicker,
-    PrimaryPushButton, PushButton, TableWidget, ToolButton,
+    PrimaryPushButton, PushButton, TableView, ToolButton,
     FluentIcon, SubtitleLabel, StrongBodyLabel,
     InfoBar, InfoBarPosition, MessageBox,
 )
@@ -21,6 +25,189 @@ from layer_thickness_app.gui.theme import muted_label_style, FlowLayout
 
 logger = logging.getLogger(__name__)
 
+# Every table cell is centred; looked up once instead of per item.
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_ALIGN_ROLE   = Qt.ItemDataRole.TextAlignmentRole
+
+
+def _format_plain(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+# Per-column display formatting for non-empty values; any column not
+# listed here is shown via ``_format_plain``.
+_CELL_FORMATTERS: dict[str, Callable[[Any], str]] = {
+    "Layer": lambda v: f"{v:.2f}" if isinstance(v, float) else _format_plain(v),
+    "ThicknessCorrected":
+        lambda v: f"{float(v):.2f}" if isinstance(v, (int, float)) else _format_plain(v),
+    "ReferenceThickness":
+        lambda v: f"{float(v):g}" if isinstance(v, (int, float)) else _format_plain(v),
+    "Wavelength": lambda v: f"{v:.3f}" if isinstance(v, float) else _format_plain(v),
+    "Date": lambda v: v[:19] if isinstance(v, str) else _format_plain(v),
+}
+
+# Columns that show an em dash instead of a blank when empty.
+_EMPTY_WITH_DASH = frozenset({
+    "ReferenceThickness", "ThicknessCorrected", "SessionTag", "Mode",
+})
+
+
+# ---------------------------------------------------------------------------
+# Background page loading
+# ---------------------------------------------------------------------------
+
+class _PageWorkerSignals(QObject):
+    """Signals emitted by _PageWorker."""
+
+    done = pyqtSignal(object, int, object)   # page key, data version, rows or None
+
+
+class _PageWorker(QRunnable):
+    """
+    Reads one batch of history rows on a QThreadPool thread, so a slow
+    filtered query never blocks the event loop. Used both for the rows
+    being shown and for prefetching the batch after them.
+    """
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        key:        tuple,
+        version:    int,
+        query:      dict[str, Any],
+    ):
+        super().__init__()
+        self.db_service = db_service
+        self.key        = key
+        self.version    = version
+        self.query      = query
+        self.signals    = _PageWorkerSignals()
+
+    def run(self):
+        try:
+            rows = self.db_service.get_measurement_rows_after(**self.query)
+        except Exception as e:
+            logger.error("Error loading history page: %s", e)
+            rows = None
+        self.signals.done.emit(self.key, self.version, rows)
+
+
+# ---------------------------------------------------------------------------
+# Table model
+# ---------------------------------------------------------------------------
+
+class _MeasurementTableModel(QAbstractTableModel):
+    """
+    Read-only model over the loaded measurement rows, as tuples laid
+    out ``(id, Date, *db_keys)`` by
+    ``DatabaseService.get_measurement_rows_after``. Cell text is
+    formatted in ``data()`` on demand, so only cells the view actually
+    paints are ever formatted and no per-cell item objects are created.
+
+    Rows arrive in batches: when the view scrolls near the end and more
+    rows exist, ``fetchMore`` emits ``fetch_more_requested`` and the
+    page appends the next batch via ``append_rows``.
+    """
+
+    fetch_more_requested = pyqtSignal()
+
+    # Row tuples lead with id and Date (the paging key) before the
+    # displayed columns.
+    _FIRST_VALUE = 2
+
+    def __init__(
+        self,
+        db_keys: list[str],
+        labels:  list[str],
+        parent:  QWidget | None = None,
+    ):
+        super().__init__(parent)
+        # Per column: formatter and the text shown when empty, resolved
+        # once so data() does no per-cell lookups by name.
+        self._columns = [
+            (
+                _CELL_FORMATTERS.get(key, _format_plain),
+                "—" if key in _EMPTY_WITH_DASH else "",
+            )
+            for key in db_keys
+        ]
+        self._labels = labels
+        self._rows: list[tuple] = []
+        self._has_more = False
+        self._fetching = False
+
+    def set_rows(self, rows: list[tuple], has_more: bool) -> None:
+        self.beginResetModel()
+        self._rows     = rows
+        self._has_more = has_more
+        self._fetching = False
+        self.endResetModel()
+
+    def append_rows(self, rows: list[tuple], has_more: bool) -> None:
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        self._has_more = has_more
+        self._fetching = False
+
+    def last_key(self) -> tuple[str, int] | None:
+        """``(Date, id)`` of the last loaded row, the next batch's cursor."""
+        if not self._rows:
+            return None
+        last = self._rows[-1]
+        return (last[1], last[0])
+
+    def row_id(self, row: int) -> int | None:
+        """DB id of the measurement shown in ``row``, if any."""
+        if not 0 <= row < len(self._rows):
+            return None
+        try:
+            return int(self._rows[row][0])
+        except (IndexError, TypeError, ValueError):
+            return None
+
+    # -- QAbstractTableModel --------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self.fetch_more_requested.emit()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self._labels[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == _ALIGN_ROLE:
+            return _ALIGN_CENTER
+        if role != _DISPLAY_ROLE and role != _TOOLTIP_ROLE:
+            return None
+
+        col   = index.column()
+        fmt, empty_text = self._columns[col]
+        value = self._rows[index.row()][col + self._FIRST_VALUE]
+        text  = empty_text if value is None or value == "" else fmt(value)
+
+        if role == _TOOLTIP_ROLE:
+            # Full text on hover so nothing is silently truncated.
+            return text if text and text != "—" else None
+        return text
+
 
 # ---------------------------------------------------------------------------
 # Detail popup
@@ -121,7 +308,7 @@ class MeasurementDetailsDialog(QDialog):
 
 class HistoryPage(QWidget):
     """
-    Browser for the measurement history with filtering, pagination,
+    Browser for the measurement history with filtering, load-on-scroll,
     inline editing and bulk deletion.
     """
 
@@ -141,7 +328,7 @@ class HistoryPage(QWidget):
     _COL_SESSION   = 9
 
     # Map table columns to DB columns.
-    _COL_DB_KEY: dict[int, str | None] = {
+    _COL_DB_KEY: dict[int, str] = {
         _COL_DATE:      "Date",
         _COL_NAME:      "Name",
         _COL_LAYER:     "Layer",
@@ -153,6 +340,8 @@ class HistoryPage(QWidget):
         _COL_PAGE:      "Page",
         _COL_SESSION:   "SessionTag",
     }
+    # Columns read per page, in display order.
+    _ROW_COLUMNS = tuple(key for _, key in sorted(_COL_DB_KEY.items()))
 
     _COL_LABELS = [
         "Date",       "Name",       "Layer (nm)",
@@ -160,29 +349,64 @@ class HistoryPage(QWidget):
         "Mode",       "Book",       "Page",      "Session",
     ]
 
-    # The DB id is hidden but stored as UserRole data on the Date item.
-    _ROW_ID_COL = _COL_DATE
-    _ROW_ID_ROLE = Qt.ItemDataRole.UserRole
-
     # Cells the user can edit via the right-click context menu.
     _EDITABLE_COLS = frozenset({_COL_REF, _COL_SESSION})
 
+    # Apply requests (filter button, sort toggles) arriving within this
+    # window share one query + table rebuild.
+    APPLY_DEBOUNCE_MS = 150
+
+    # Rows read per batch as the table is scrolled.
+    FETCH_BATCH = 50
+
+    # Recently read batches, e.g. prefetched ones not yet scrolled to.
+    PAGE_CACHE_SIZE = 8
+
     def __init__(self, db_service: DatabaseService, parent: QWidget | None = None):
         super().__init__(parent)
         self.db_service = db_service
         self.setObjectName("HistoryPage")
 
-        self.current_page     = 1
-        self.items_per_page   = 20
-        self.total_items      = 0
-        self.total_pages      = 1
+        # Batch rows keyed by (filters, sort, keyset cursor, limit); only
+        # valid for the DB data_version they were read at.
+        self._page_cache: OrderedDict[tuple, list[tuple]] = OrderedDict()
+        self._page_cache_version = -1
+        self._pages_inflight: set[tuple] = set()
+        # Batch waiting to be shown as (key, limit, append), None when the
+        # table is current.
+        self._pending_page: tuple[tuple, int, bool] | None = None
+
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(self.APPLY_DEBOUNCE_MS)
+        self._apply_timer.timeout.connect(self._apply_filters)
+
+        # Filters/sort as of the last apply. Paging and data refreshes
+        # reuse them instead of re-reading and re-formatting the widgets.
+        self._applied_filters: dict[str, Any] = {}
+        self._applied_sort = "DESC"
+        self._names_version = -1   # data_version the name combo was filled at
+        # Nothing is read until the page is first shown; changes reported
+        # while it is hidden are picked up on the next show.
+        self._data_loaded = False
+        self._data_stale  = False
 
         self._init_widgets()
         self._init_layout()
         self._connect_signals()
 
-        self._load_name_suggestions()
-        self._refresh_data()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._data_loaded:
+            self._data_loaded = True
+            self._apply_filters()
+            # The name list is only needed once the user opens the combo;
+            # let the first rows go out before its DISTINCT scan.
+            QTimer.singleShot(0, self._load_name_suggestions)
+        elif self._data_stale:
+            self._data_stale = False
+            self._load_name_suggestions()
+            self._refresh_data()
 
     # ==================================================================
     # Widget / layout
@@ -205,9 +429,12 @@ class HistoryPage(QWidget):
         self.refresh_button = ToolButton(FluentIcon.SYNC, self)
         self.refresh_button.setToolTip("Refresh data (reloads filter suggestions too)")
 
-        self.table = TableWidget(self)
-        self.table.setColumnCount(len(self._COL_LABELS))
-        self.table.setHorizontalHeaderLabels(self._COL_LABELS)
+        # The DB id stays hidden; the model keeps it with each row.
+        self.table_model = _MeasurementTableModel(
+            list(self._ROW_COLUMNS), self._COL_LABELS, self,
+        )
+        self.table = TableView(self)
+        self.table.setModel(self.table_model)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.verticalHeader().hide()
@@ -229,10 +456,9 @@ class HistoryPage(QWidget):
         self.table.setColumnWidth(self._COL_BOOK,      80)
         self.table.setColumnWidth(self._COL_PAGE,      80)
 
-        self.prev_button = ToolButton(FluentIcon.LEFT_ARROW,  self)
-        self.next_button = ToolButton(FluentIcon.RIGHT_ARROW, self)
-        self.page_label  = CaptionLabel("Page 1 of 1", self)
-        self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.rows_label = CaptionLabel("", self)
+        self.rows_label.setStyleSheet(muted_label_style())
+        self.rows_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def _init_layout(self):
         root = QVBoxLayout(self)
@@ -262,16 +488,9 @@ class HistoryPage(QWidget):
         )
         hint.setStyleSheet(muted_label_style())
 
-        nav = QHBoxLayout()
-        nav.addStretch(1)
-        nav.addWidget(self.prev_button)
-        nav.addWidget(self.page_label)
-        nav.addWidget(self.next_button)
-        nav.addStretch(1)
-
         root.addWidget(hint)
         root.addWidget(self.table, 1)
-        root.addLayout(nav)
+        root.addWidget(self.rows_label)
 
     @staticmethod
     def _make_field(label_text: str, widget: QWidget) -> QWidget:
@@ -290,10 +509,9 @@ class HistoryPage(QWidget):
         self.reset_button.clicked.connect(self._on_filter_reset)
         self.refresh_button.clicked.connect(self._on_full_refresh)
         self.sort_order_combo.currentIndexChanged.connect(self._on_filter_apply)
-        self.prev_button.clicked.connect(self._on_prev_page)
-        self.next_button.clicked.connect(self._on_next_page)
+        self.table_model.fetch_more_requested.connect(self._on_fetch_more)
 
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_cell_double_clicked)
         self.table.customContextMenuRequested.connect(self._on_context_menu)
 
     # ==================================================================
@@ -301,35 +519,35 @@ class HistoryPage(QWidget):
     # ==================================================================
 
     def _on_filter_apply(self):
-        self.current_page = 1
-        self._refresh_data()
+        self._apply_timer.start()
 
     def _on_filter_reset(self):
-        self.name_filter.setCurrentIndex(-1)
-        self.start_date_filter.setDate(QDate(2024, 1, 1))
-        self.end_date_filter.setDate(QDate(2030, 12, 31))
-        self.sort_order_combo.setCurrentIndex(0)
-        self.current_page = 1
-        self._refresh_data()
+        # The sort combo would otherwise trigger its own apply on top of
+        # the refresh below.
+        with QSignalBlocker(self.sort_order_combo):
+            self.name_filter.setCurrentIndex(-1)
+            self.start_date_filter.setDate(QDate(2024, 1, 1))
+            self.end_date_filter.setDate(QDate(2030, 12, 31))
+            self.sort_order_combo.setCurrentIndex(0)
+        self._apply_timer.stop()
+        self._apply_filters()
 
     def _on_full_refresh(self):
         self._load_name_suggestions()
+        # An explicit refresh always re-reads the rows.
+        self._page_cache.clear()
         self._refresh_data()
 
     def refresh_data(self) -> None:
         """Public hook used by the controller when measurements change."""
+        if not self.isVisible():
+            self._data_stale = True
+            return
         self._load_name_suggestions()
         self._refresh_data()
 
-    def _on_prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-            self._refresh_data()
-
-    def _on_next_page(self):
-        if self.current_page < self.total_pages:
-            self.current_page += 1
-            self._refresh_data()
+    def _on_fetch_more(self):
+        self._request_rows(self.table_model.last_key(), self.FETCH_BATCH, append=True)
 
     # ==================================================================
     # Data loading
@@ -337,6 +555,10 @@ class HistoryPage(QWidget):
 
     def _load_name_suggestions(self):
         """Repopulate the Name filter combo, preserving current selection."""
+        version = self.db_service.data_version
+        if version == self._names_version:
+            return
+        self._names_version = version
         current_name = self.name_filter.currentText()
         names = self.db_service.get_unique_names()
         self.name_filter.blockSignals(True)
@@ -358,88 +580,133 @@ class HistoryPage(QWidget):
             "end_date":    end.toString("yyyy-MM-dd")   if end.isValid()   else None,
         }
 
+    def _apply_filters(self):
+        """Snapshots the filter widgets, then reloads from the first row."""
+        self._applied_filters = self._get_current_filters()
+        self._applied_sort = (
+            "DESC" if self.sort_order_combo.currentIndex() == 0 else "ASC"
+        )
+        self._request_rows(None, self.FETCH_BATCH, append=False)
+
     def _refresh_data(self):
         """
-        Reloads the current page using the windowed-count paginated read,
-        which gives us rows + total in a single round-trip.
+        Re-reads everything loaded so far in one query, so edits and
+        deletes show up without the table jumping back to the top.
         """
-        filters  = self._get_current_filters()
-        sort_dir = "DESC" if self.sort_order_combo.currentIndex() == 0 else "ASC"
-
-        rows, total = self.db_service.get_measurements(
-            **filters,
-            page_num  = self.current_page,
-            per_page  = self.items_per_page,
-            order_by  = "Date",
-            order_dir = sort_dir,
-        )
+        limit = max(self.FETCH_BATCH, self.table_model.rowCount())
+        self._request_rows(None, limit, append=False)
 
-        self.total_items = total
-        self.total_pages = max(
-            1, (self.total_items + self.items_per_page - 1) // self.items_per_page
+    def _request_rows(
+        self, cursor: tuple[str, int] | None, limit: int, append: bool
+    ) -> None:
+        """
+        Shows up to ``limit`` rows after ``cursor``, replacing the table
+        or appending to it. One extra row is read to tell whether more
+        exist, so no COUNT over the filtered set is needed. Cached batches
+        are shown at once; anything else is read on the thread pool and
+        shown from ``_on_rows_loaded``.
+        """
+        if self.db_service.data_version != self._page_cache_version:
+            self._page_cache.clear()
+            self._page_cache_version = self.db_service.data_version
+
+        key  = self._page_key(cursor, limit)
+        rows = self._page_cache.get(key)
+        if rows is not None:
+            self._page_cache.move_to_end(key)
+            self._pending_page = None
+            self._show_rows(rows, limit, append)
+            return
+
+        self._pending_page = (key, limit, append)
+        self._load_rows(cursor, limit)
+
+    def _show_rows(self, rows: list[tuple], limit: int, append: bool) -> None:
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if append:
+            self.table_model.append_rows(rows, has_more)
+        else:
+            self.table_model.set_rows(rows, has_more)
+        if has_more:
+            # Have the next batch ready before the user scrolls to it.
+            self._load_rows(self.table_model.last_key(), self.FETCH_BATCH)
+
+        shown = self.table_model.rowCount()
+        self.rows_label.setText(
+            f"{shown} measurement(s) shown, scroll for more" if has_more
+            else f"{shown} measurement(s)"
         )
-        self.current_page = min(self.current_page, self.total_pages)
 
-        self._populate_table(rows)
+    def _page_key(self, cursor: tuple[str, int] | None, limit: int) -> tuple:
+        f = self._applied_filters
+        return (
+            f.get("name_filter"), f.get("start_date"), f.get("end_date"),
+            self._applied_sort, cursor, limit,
+        )
 
-        self.page_label.setText(f"Page {self.current_page} of {self.total_pages}")
-        self.prev_button.setEnabled(self.current_page > 1)
-        self.next_button.setEnabled(self.current_page < self.total_pages)
+    def _cache_page(self, key: tuple, rows: list[tuple]) -> None:
+        self._page_cache[key] = rows
+        self._page_cache.move_to_end(key)
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
 
-    def _populate_table(self, measurements: list[dict[str, Any]]):
-        self.table.setUpdatesEnabled(False)
-        try:
-            self.table.clearContents()
-            self.table.setRowCount(len(measurements))
-
-            for row_idx, record in enumerate(measurements):
-                for col_idx, db_key in self._COL_DB_KEY.items():
-                    value = record.get(db_key) if db_key else ""
-                    item  = self._build_item(col_idx, db_key, value)
-                    if col_idx == self._ROW_ID_COL:
-                        # Stash the DB id on the row's date cell — kept
-                        # off-screen so users don't see it but recoverable
-                        # by every action that needs it.
-                        item.setData(self._ROW_ID_ROLE, record.get("id"))
-                    self.table.setItem(row_idx, col_idx, item)
-        finally:
-            self.table.setUpdatesEnabled(True)
-
-    def _build_item(
-        self, col_idx: int, db_key: str | None, value: Any,
-    ) -> QTableWidgetItem:
-        empty_with_dash = (
-            "ReferenceThickness", "ThicknessCorrected",
-            "SessionTag", "Mode",
+    def _load_rows(self, cursor: tuple[str, int] | None, limit: int) -> None:
+        """
+        Reads ``limit`` + 1 rows after ``cursor`` under the applied filters
+        into the cache in the background, unless cached or already loading.
+        """
+        key = self._page_key(cursor, limit)
+        if key in self._page_cache or key in self._pages_inflight:
+            return
+        self._pages_inflight.add(key)
+        worker = _PageWorker(
+            self.db_service, key, self._page_cache_version,
+            {
+                **self._applied_filters,
+                "columns":   self._ROW_COLUMNS,
+                "after":     cursor,
+                "limit":     limit + 1,
+                "order_dir": self._applied_sort,
+            },
         )
-        if value is None or value == "":
-            text = "—" if db_key in empty_with_dash else ""
-        elif db_key == "Layer" and isinstance(value, float):
-            text = f"{value:.2f}"
-        elif db_key == "ThicknessCorrected" and isinstance(value, (int, float)):
-            text = f"{float(value):.2f}"
-        elif db_key == "ReferenceThickness" and isinstance(value, (int, float)):
-            text = f"{float(value):g}"
-        elif db_key == "Wavelength" and isinstance(value, float):
-            text = f"{value:.3f}"
-        elif db_key == "Date" and isinstance(value, str):
-            text = value[:19]
-        else:
-            text = str(value)
+        worker.signals.done.connect(self._on_rows_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_rows_loaded(
+        self, key: tuple, version: int, rows: list[tuple] | None
+    ) -> None:
+        self._pages_inflight.discard(key)
+        fresh = version == self._page_cache_version == self.db_service.data_version
+        if rows is not None and fresh:
+            self._cache_page(key, rows)
+        if self._pending_page is None or key != self._pending_page[0]:
+            return
 
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Full text on hover so nothing is silently truncated.
-        if text and text != "—":
-            item.setToolTip(text)
-        return item
+        _, limit, append = self._pending_page
+        if rows is None:
+            self._pending_page = None
+            # Stop asking for more until the next reload.
+            self.table_model.append_rows([], has_more=False)
+            self._show_info_bar("Error", "Could not load measurements.",
+                                is_error=True)
+        elif fresh:
+            self._pending_page = None
+            self._show_rows(rows, limit, append)
+        elif append:
+            # Read before a write landed; the loaded rows are stale too.
+            self._refresh_data()
+        else:
+            self._request_rows(None, limit, append=False)
 
     # ==================================================================
     # Bulk delete
     # ==================================================================
 
     def _on_delete_filtered(self):
-        filters = self._get_current_filters()
+        # The filters the table was loaded with, not unapplied widget
+        # edits, so the deletion covers exactly what the table lists.
+        filters = dict(self._applied_filters)
         count   = self.db_service.get_measurements_count(**filters)
         if count == 0:
             self._show_info_bar("No Data", "No items match the filters to delete.",
@@ -448,7 +715,7 @@ class HistoryPage(QWidget):
 
         msg = (
             f"You are about to permanently delete {count} measurement(s) "
-            f"matching the current filters.\n\n"
+            f"matching the applied filters.\n\n"
             f"This also deletes their image files.\nAre you sure?"
         )
         w = MessageBox("Delete Measurements?", msg, self)
@@ -486,15 +753,15 @@ class HistoryPage(QWidget):
     # Inline editing
     # ==================================================================
 
-    def _on_cell_double_clicked(self, row: int, col: int) -> None:
+    def _on_cell_double_clicked(self, index: QModelIndex) -> None:
         # Double-click anywhere in the row opens the full-record popup.
-        self._show_details_popup(row)
+        self._show_details_popup(index.row())
 
     def _on_context_menu(self, pos) -> None:
         index = self.table.indexAt(pos)
         if not index.isValid():
             return
-        row, _col = index.row(), index.column()
+        row = index.row()
 
         menu = QMenu(self.table)
         act_view      = menu.addAction("View Details…")
@@ -515,16 +782,7 @@ class HistoryPage(QWidget):
         if action is act_delete:    self._delete_single(row)
 
     def _row_id(self, row: int) -> int | None:
-        item = self.table.item(row, self._ROW_ID_COL)
-        if item is None:
-            return None
-        val = item.data(self._ROW_ID_ROLE)
-        if val is None:
-            return None
-        try:
-            return int(val)
-        except (TypeError, ValueError):
-            return None
+        return self.table_model.row_id(row)
 
     def _edit_cell(self, row: int, col_or_key) -> None:
         """
@@ -590,24 +848,12 @@ class HistoryPage(QWidget):
     def _update_single_field(
         self, row_id: int, column: str, value: Any,
     ) -> bool:
-        """
-        Direct UPDATE on the measurements table. The column name is
-        whitelisted so a plain f-string is safe here.
-        """
+        """Only the columns the context menu offers may be edited."""
         allowed = {"ReferenceThickness", "SessionTag", "Note"}
         if column not in allowed:
             logger.error("Rejected update to column %s", column)
             return False
-        try:
-            self.db_service.cursor.execute(
-                f"UPDATE measurements SET {column} = ? WHERE id = ?",
-                (value, row_id),
-            )
-            self.db_service.conn.commit()
-            return self.db_service.cursor.rowcount > 0
-        except Exception as e:
-            logger.exception("Update failed: %s", e)
-            return False
+        return self.db_service.update_measurement_field(row_id, column, value)
 
     def _delete_single(self, row: int) -> None:
         row_id = self._row_id(row)
@@ -275,7 +275,7 @@ class HomePage(QWidget):
     # ------------------------------------------------------------------
 
     def _connect_signals(self):
-        self.refresh_button.clicked.connect(self.refresh_camera_list)
+        self.refresh_button.clicked.connect(self._on_refresh_clicked)
         self.connect_button.clicked.connect(self.toggle_camera_connection)
         self.exposure_apply_button.clicked.connect(self._on_exposure_apply_clicked)
 
@@ -288,11 +288,13 @@ class HomePage(QWidget):
             logger.info("Attempting to auto-connect to camera...")
             first_cam_id = self.available_cameras[0]["id"]
 
-            if self.camera_service.connect(first_cam_id):
+            connected = self.camera_service.connect(first_cam_id)
+            status    = self.camera_service.get_status()
+            if connected:
                 self._after_camera_connected()
                 InfoBar.success(
                     title="Camera Auto-Connected",
-                    content=f"Connected to {self.camera_service.get_status()['model']}.",
+                    content=f"Connected to {status['model']}.",
                     duration=3000, parent=self, position=InfoBarPosition.TOP,
                 )
             else:
@@ -302,13 +304,21 @@ class HomePage(QWidget):
                     parent=self, position=InfoBarPosition.TOP,
                 )
 
-            self.update_status_display()
+            self.update_status_display(status)
 
-    def refresh_camera_list(self):
-        if self.camera_service.get_status()["connected"]:
+    def _on_refresh_clicked(self):
+        # An explicit refresh must see newly plugged-in cameras, so it
+        # bypasses the service's short-lived enumeration cache.
+        self.refresh_camera_list(force=True)
+
+    def refresh_camera_list(self, force: bool = False):
+        status = self.camera_service.get_status()
+        if status["connected"]:
             return
 
-        self.available_cameras = self.camera_service.list_available_cameras()
+        self.available_cameras = self.camera_service.list_available_cameras(
+            force=force
+        )
 
         combo = self.camera_selector_card.comboBox
         combo.clear()
@@ -318,13 +328,12 @@ class HomePage(QWidget):
             combo.setEnabled(False)
             self.connect_button.setEnabled(False)
         else:
-            cam_names = [f"ID {cam['id']}: {cam['model']}" for cam in self.available_cameras]
-            combo.addItems(cam_names)
+            combo.addItems([cam["display"] for cam in self.available_cameras])
             combo.setEnabled(True)
             self.connect_button.setEnabled(True)
             combo.setCurrentIndex(0)
 
-        self.update_status_display()
+        self.update_status_display(status)
 
     def toggle_camera_connection(self):
         if self.camera_service.get_status()["connected"]:
@@ -335,42 +344,46 @@ class HomePage(QWidget):
                 content="The camera has been disconnected.",
                 duration=3000, parent=self, position=InfoBarPosition.TOP,
             )
+            # Re-lists the cameras and updates the status display.
             self.refresh_camera_list()
-        else:
-            if not self.available_cameras:
-                InfoBar.error(
-                    title="Error",
-                    content="No cameras available to connect.",
-                    parent=self, position=InfoBarPosition.TOP,
-                )
-                return
+            return
 
-            selected_index = self.camera_selector_card.comboBox.currentIndex()
-            if selected_index < 0:
-                InfoBar.error(
-                    title="Error",
-                    content="No camera selected.",
-                    parent=self, position=InfoBarPosition.TOP,
-                )
-                return
+        if not self.available_cameras:
+            InfoBar.error(
+                title="Error",
+                content="No cameras available to connect.",
+                parent=self, position=InfoBarPosition.TOP,
+            )
+            return
+
+        selected_index = self.camera_selector_card.comboBox.currentIndex()
+        if selected_index < 0:
+            InfoBar.error(
+                title="Error",
+                content="No camera selected.",
+                parent=self, position=InfoBarPosition.TOP,
+            )
+            return
 
-            selected_cam_id = self.available_cameras[selected_index]["id"]
+        selected_cam_id = self.available_cameras[selected_index]["id"]
 
-            if self.camera_service.connect(selected_cam_id):
-                self._after_camera_connected()
-                InfoBar.success(
-                    title="Camera Connected",
-                    content=f"Connected to {self.camera_service.get_status()['model']}.",
-                    duration=3000, parent=self, position=InfoBarPosition.TOP,
-                )
-            else:
-                InfoBar.error(
-                    title="Connection Failed",
-                    content="Could not initialize the selected camera.",
-                    parent=self, position=InfoBarPosition.TOP,
-                )
+        connected = self.camera_service.connect(selected_cam_id)
+        status    = self.camera_service.get_status()
+        if connected:
+            self._after_camera_connected()
+            InfoBar.success(
+                title="Camera Connected",
+                content=f"Connected to {status['model']}.",
+                duration=3000, parent=self, position=InfoBarPosition.TOP,
+            )
+        else:
+            InfoBar.error(
+                title="Connection Failed",
+                content="Could not initialize the selected camera.",
+                parent=self, position=InfoBarPosition.TOP,
+            )
 
-        self.update_status_display()
+        self.update_status_display(status)
 
     # ------------------------------------------------------------------
     # Exposure handling
@@ -452,8 +465,10 @@ class HomePage(QWidget):
             duration=2500, parent=self, position=InfoBarPosition.TOP,
         )
 
-    def update_status_display(self):
-        status = self.camera_service.get_status()
+    def update_status_display(self, status: dict[str, Any] | None = None):
+        """Reflects ``status`` (read from the camera service if omitted)."""
+        if status is None:
+            status = self.camera_service.get_status()
 
         if status["connected"]:
             self.status_label.setText("Connected")
@@ -25,7 +25,7 @@ from PyQt6.QtGui import (
     QKeySequence,
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from qfluentwidgets import InfoBar, InfoBarPosition
+from qfluentwidgets import IndeterminateProgressRing, InfoBar, InfoBarPosition
 
 from layer_thickness_app.config.config import AppConfig
 from layer_thickness_app.gui.theme import (
@@ -45,8 +45,8 @@ logger = logging.getLogger(__name__)
 class MaterialSelector(QFrame):
     """
     Three cascading combo-boxes over the refractiveindex.info catalog.
-    Emits ``selection_changed(str | None)`` whenever the full
-    shelf/book/page path becomes valid or invalid.
+    Emits ``selection_changed(tuple[str, str, str] | None)`` whenever the
+    full shelf/book/page selection becomes valid or invalid.
     """
 
     selection_changed = pyqtSignal(object)
@@ -140,16 +140,24 @@ class MaterialSelector(QFrame):
         self._select_first_available(self.page_combo)
 
     def _emit_selection(self, _=None):
-        self.selection_changed.emit(self.get_selected_path())
+        self.selection_changed.emit(self.get_selected_tuple())
 
-    def get_selected_path(self) -> str | None:
+    def get_selected_tuple(self) -> tuple[str, str, str] | None:
+        """
+        The selected ``(shelf, book, page)`` keys straight from the combo
+        item data, or None if the selection is incomplete.
+        """
         shelf = self.shelf_combo.currentData()
         book  = self.book_combo.currentData()
         page  = self.page_combo.currentData()
         if shelf and book and page and not str(book).startswith("__DIVIDER"):
-            return f"{shelf}/{book}/{page}"
+            return shelf, book, page
         return None
 
+    def get_selected_path(self) -> str | None:
+        selection = self.get_selected_tuple()
+        return "/".join(selection) if selection else None
+
 
 # ---------------------------------------------------------------------------
 # MeasurePage
@@ -503,6 +511,12 @@ class MeasurePage(QWidget):
         self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.result_label.setFont(title_font(18, bold=True))
         layout.addWidget(self.result_label)
+
+        # Spins while a calculation runs on the worker thread.
+        self.busy_ring = IndeterminateProgressRing()
+        self.busy_ring.setFixedSize(28, 28)
+        self.busy_ring.hide()
+        layout.addWidget(self.busy_ring, alignment=Qt.AlignmentFlag.AlignCenter)
         return frame
 
     # ==================================================================
@@ -555,8 +569,8 @@ class MeasurePage(QWidget):
             not self.save_measurement_checkbox.isChecked()
         )
 
-    def _on_material_changed(self, path):
-        self.material_changed.emit(path)
+    def _on_material_changed(self, material):
+        self.material_changed.emit(material)
 
     def _on_sample_button_clicked(self):
         # Route to the batch flow whenever the user has Batch Mode
@@ -630,6 +644,7 @@ class MeasurePage(QWidget):
             "mat_capture":            self.material_capture,
             "frame_count":            self.get_frame_count(),
             "material_path":          self.material_selector.get_selected_path(),
+            "material":               self.material_selector.get_selected_tuple(),
             "wavelength_um":          self.wavelength_combo.currentData(),
             "save_checked":           self.save_measurement_checkbox.isChecked(),
             "use_name":               self.use_name_checkbox.isChecked(),
@@ -778,19 +793,17 @@ class MeasurePage(QWidget):
         if hasattr(self, "material_selector"):
             self.material_selector.populate_data(data)
 
-    def set_result_text(self, text: str, append: bool = False):
+    def set_result_text(self, text: str):
         if not hasattr(self, "result_label"):
             return
-        if append:
-            current = self.result_label.text()
-            if "Saved!" not in current:
-                self.result_label.setText(f"{current}<br>Saved!")
-        else:
-            self.result_label.setText(text)
+        self.result_label.setText(text)
 
     def set_calculation_enabled(self, enabled: bool):
         self.calculate_button.setEnabled(enabled)
 
+    def set_calculation_busy(self, busy: bool):
+        self.busy_ring.setVisible(busy)
+
     def show_info_bar(
         self,
         title:      str,
@@ -847,9 +860,11 @@ class MeasurePage(QWidget):
                 logger.error("Error converting image: expected 3 channels, got %s", channels)
                 return QPixmap()
             stride = image_array.strides[0]
+            # fromImage copies the pixels itself, so the QImage can wrap
+            # the array without a detached copy of its own.
             q_image = QImage(
                 image_array.data, width, height, stride, QImage.Format.Format_BGR888,
-            ).copy()
+            )
             return QPixmap.fromImage(q_image)
         except Exception as e:
             logger.error("Error converting image: %s", e)
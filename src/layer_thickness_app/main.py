@@ -14,7 +14,7 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel, QWidget, QVBoxLayout
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt, QTimer, qInstallMessageHandler, QtMsgType
 
 from layer_thickness_app.controller.main_controller import MainController
@@ -71,19 +71,16 @@ logger = logging.getLogger(__name__)
 class SplashWindow(QMainWindow):
     """Borderless splash window shown during main-window construction."""
 
-    def __init__(self, image_path: Path):
+    def __init__(self, icon: QIcon):
         super().__init__()
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.resize(1100, 800)
 
-        label  = QLabel()
-        pixmap = QPixmap(str(image_path))
-        label.setPixmap(pixmap.scaled(
-            300, 300,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        ))
+        # Rendered from the already-loaded app icon (aspect ratio kept), so
+        # the SVG isn't parsed a second time just for the splash.
+        label = QLabel()
+        label.setPixmap(icon.pixmap(300, 300))
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         layout = QVBoxLayout()
@@ -98,11 +95,11 @@ class SplashWindow(QMainWindow):
 
 
 def load_stylesheet(qss_file: Path) -> str:
-    if not qss_file.exists():
-        logger.warning("Stylesheet file not found: %s", qss_file)
-        return ""
     try:
         return qss_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("Stylesheet file not found: %s", qss_file)
+        return ""
     except OSError as e:
         logger.error("Error reading stylesheet %s: %s", qss_file, e)
         return ""
@@ -147,12 +144,14 @@ def main():
 
     app = QApplication(sys.argv)
 
-    if ICON_PATH.exists():
-        app.setWindowIcon(QIcon(str(ICON_PATH)))
-    else:
+    # A missing file yields a null QIcon, so no separate exists() probe.
+    app_icon = QIcon(str(ICON_PATH))
+    if app_icon.isNull():
         logger.warning("Icon file not found at %s", ICON_PATH)
+    else:
+        app.setWindowIcon(app_icon)
 
-    splash = SplashWindow(ICON_PATH)
+    splash = SplashWindow(app_icon)
     splash.show()
     app.processEvents()
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import numpy as np
 from dataclasses import dataclass
 from pyueye import ueye
@@ -69,6 +71,10 @@ class CameraService:
     statistics.
     """
 
+    # Enumerations younger than this are reused, so repeated Refresh
+    # clicks don't each go through is_GetCameraList.
+    CAMERA_LIST_TTL_S = 2.0
+
     def __init__(self):
         self.h_cam            = ueye.HIDS(0)
         self.pc_image_memory  = ueye.c_mem_p()
@@ -78,12 +84,34 @@ class CameraService:
         self.height           = ueye.int()
         self.model_name       = ""
         self.bits_per_pixel   = ueye.int(24)
+        # Captures run on a worker thread; this keeps a disconnect from
+        # the GUI thread from freeing the image memory mid-capture.
+        self._io_lock         = threading.RLock()
+        # Float32 scratch for multi-frame averaging, reused across captures
+        # (they are serialised by _io_lock) and never handed to callers.
+        self._accum_buf: np.ndarray | None = None
+        # (monotonic timestamp, cameras) of the last enumeration.
+        self._camera_list_cache: tuple[float, list[dict[str, Any]]] | None = None
 
     # ------------------------------------------------------------------
     # Camera discovery and lifecycle
     # ------------------------------------------------------------------
 
-    def list_available_cameras(self) -> list[dict[str, Any]]:
+    def list_available_cameras(self, force: bool = False) -> list[dict[str, Any]]:
+        """
+        Cameras not in use by any process. A result younger than
+        CAMERA_LIST_TTL_S is reused unless ``force`` is set.
+        """
+        cached = self._camera_list_cache
+        if (not force and cached is not None
+                and time.monotonic() - cached[0] < self.CAMERA_LIST_TTL_S):
+            return list(cached[1])
+
+        cameras = self._enumerate_cameras()
+        self._camera_list_cache = (time.monotonic(), cameras)
+        return list(cameras)
+
+    def _enumerate_cameras(self) -> list[dict[str, Any]]:
         try:
             cam_list = ueye.UEYE_CAMERA_LIST()
             if ueye.is_GetCameraList(cam_list) != ueye.IS_SUCCESS:
@@ -99,9 +127,12 @@ class CameraService:
             for i in range(n_cameras):
                 cam_info = cam_list.uci[i]
                 if cam_info.dwInUse == 0:
+                    cam_id = int(cam_info.dwCameraID)
+                    model  = cam_info.Model.decode("utf-8").strip("\x00").strip()
                     result.append({
-                        "id":    int(cam_info.dwCameraID),
-                        "model": cam_info.Model.decode("utf-8").strip("\x00").strip(),
+                        "id":      cam_id,
+                        "model":   model,
+                        "display": f"ID {cam_id}: {model}",
                     })
             return result
         except Exception as e:
@@ -111,6 +142,8 @@ class CameraService:
     def connect(self, camera_id: int) -> bool:
         if self.is_connected:
             self.disconnect()
+        # Connecting changes which cameras are in use.
+        self._camera_list_cache = None
 
         self.h_cam = ueye.HIDS(camera_id)
 
@@ -166,21 +199,24 @@ class CameraService:
         }
 
     def disconnect(self):
-        if self.h_cam.value == 0:
-            return
-        if self.is_connected:
-            ueye.is_StopLiveVideo(self.h_cam, ueye.IS_WAIT)
-            if self.pc_image_memory.value:
-                ueye.is_FreeImageMem(self.h_cam, self.pc_image_memory, self.mem_id)
-            ueye.is_ExitCamera(self.h_cam)
-        logger.info("Camera %s disconnected.", self.h_cam.value)
-        self.h_cam           = ueye.HIDS(0)
-        self.pc_image_memory = ueye.c_mem_p()
-        self.mem_id          = ueye.int()
-        self.is_connected    = False
-        self.width           = ueye.int()
-        self.height          = ueye.int()
-        self.model_name      = ""
+        with self._io_lock:
+            if self.h_cam.value == 0:
+                return
+            if self.is_connected:
+                ueye.is_StopLiveVideo(self.h_cam, ueye.IS_WAIT)
+                if self.pc_image_memory.value:
+                    ueye.is_FreeImageMem(self.h_cam, self.pc_image_memory, self.mem_id)
+                ueye.is_ExitCamera(self.h_cam)
+            logger.info("Camera %s disconnected.", self.h_cam.value)
+            self._camera_list_cache = None
+            self.h_cam           = ueye.HIDS(0)
+            self.pc_image_memory = ueye.c_mem_p()
+            self.mem_id          = ueye.int()
+            self.is_connected    = False
+            self.width           = ueye.int()
+            self.height          = ueye.int()
+            self.model_name      = ""
+            self._accum_buf      = None
 
     def __del__(self):
         self.disconnect()
@@ -299,7 +335,12 @@ class CameraService:
     # Low-level hardware capture
     # ------------------------------------------------------------------
 
-    def _read_raw_frame(self) -> np.ndarray | None:
+    def _read_raw_frame(self, out: np.ndarray | None = None) -> np.ndarray | None:
+        """
+        Grab one frame. The driver reuses its image memory, so the pixels
+        are copied out: into ``out`` when given (shape (h, w, bpp),
+        uint8), otherwise into a freshly allocated array.
+        """
         ret = ueye.is_FreezeVideo(self.h_cam, ueye.IS_WAIT)
         if ret != ueye.IS_SUCCESS:
             logger.error("is_FreezeVideo failed. Code: %s", ret)
@@ -309,11 +350,20 @@ class CameraService:
             w, h = self.width.value, self.height.value
             raw  = ueye.get_data(self.pc_image_memory, w, h,
                                  self.bits_per_pixel, w * bpp, True)
-            return np.reshape(raw, (h, w, bpp)).copy()
+            frame = np.reshape(raw, (h, w, bpp))
+            if out is None:
+                return frame.copy()
+            np.copyto(out, frame)
+            return out
         except Exception as e:
             logger.exception("Failed to read frame from camera memory: %s", e)
             return None
 
+    def _accumulator_for(self, shape: tuple[int, ...]) -> np.ndarray:
+        if self._accum_buf is None or self._accum_buf.shape != shape:
+            self._accum_buf = np.empty(shape, dtype=np.float32)
+        return self._accum_buf
+
     # ------------------------------------------------------------------
     # Public capture API
     # ------------------------------------------------------------------
@@ -337,7 +387,18 @@ class CameraService:
         ``wavelength_um`` selects the Bayer channel used for the hotspot
         statistic (635 nm → red, 532 nm → green). Whole-frame gray
         statistics are wavelength-independent and always use ITU-R 601.
+
+        Safe to call from a worker thread.
         """
+        with self._io_lock:
+            return self._capture_frame(n_frames, outlier_sigma, wavelength_um)
+
+    def _capture_frame(
+        self,
+        n_frames:      int,
+        outlier_sigma: float,
+        wavelength_um: float,
+    ) -> FrameCaptureResult | None:
         if not self.is_connected:
             logger.error("capture_frame: camera not connected.")
             return None
@@ -363,10 +424,16 @@ class CameraService:
         logger.info("Multi-frame capture: requesting %d frames (sigma=%.1f).",
                     n_frames, outlier_sigma)
 
+        # One block for the whole burst instead of a fresh allocation per
+        # frame; each read is copied straight into its slot.
+        bpp    = int(self.bits_per_pixel.value / 8)
+        burst  = np.empty((n_frames, self.height.value, self.width.value, bpp),
+                          dtype=np.uint8)
+
         raw_frames:   list[np.ndarray] = []
         gray_scalars: list[float]      = []
         for i in range(n_frames):
-            raw = self._read_raw_frame()
+            raw = self._read_raw_frame(out=burst[len(raw_frames)])
             if raw is None:
                 logger.warning("Frame %d/%d: hardware read failed, skipping.",
                                i + 1, n_frames)
@@ -414,24 +481,26 @@ class CameraService:
                 logger.debug("Multi-frame: sigma = 0, all frames identical.")
 
         # Incremental float32 accumulator avoids an N*H*W*3 stack.
-        accumulator: np.ndarray | None = None
+        accumulator = self._accumulator_for(raw_frames[0].shape)
         n_kept = 0
         kept_grays: list[float] = []
         for frame, gray, keep in zip(raw_frames, gray_scalars, keep_mask):
             if not keep:
                 continue
-            if accumulator is None:
-                accumulator = frame.astype(np.float32)
+            if n_kept == 0:
+                np.copyto(accumulator, frame)
             else:
                 accumulator += frame
             n_kept += 1
             kept_grays.append(gray)
 
-        if accumulator is None or n_kept == 0:
+        if n_kept == 0:
             logger.error("Multi-frame: no frames left after rejection.")
             return None
 
-        avg_frame = (accumulator / float(n_kept)).astype(np.uint8)
+        accumulator /= float(n_kept)
+        avg_frame = accumulator.astype(np.uint8)
+        del burst, raw_frames
 
         clean_arr = np.asarray(kept_grays, dtype=np.float64)
         gray_mean = float(clean_arr.mean())
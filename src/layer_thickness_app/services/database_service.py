@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +28,21 @@ VALID_CAL_COLUMNS = frozenset({
     "IsActive", "Note",
 })
 
+# WHERE fragment and parameter name for each ``_build_filter_query``
+# argument, in signature order.
+_FILTER_CLAUSES = (
+    ("Name = :name",              "name"),
+    ("DATE(Date) >= :start_date", "start_date"),
+    ("DATE(Date) <= :end_date",   "end_date"),
+    ("Shelf = :shelf",            "shelf"),
+    ("Book = :book",              "book"),
+    ("Page = :page",              "page"),
+    ("Note LIKE :note",           "note"),
+    ("SessionTag = :session_tag", "session_tag"),
+    ("Mode = :mode_filter",       "mode_filter"),
+    ("Probe = :probe",            "probe"),
+)
+
 
 class DatabaseService:
     """Persists measurements and calibration models in a local SQLite DB."""
@@ -40,17 +56,45 @@ class DatabaseService:
             self.image_dir_path = db_parent_dir / "images"
             self.image_dir_path.mkdir(parents=True, exist_ok=True)
 
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            # The filter builders produce many distinct-but-recurring SQL
+            # strings (one per filter combination); a larger statement
+            # cache than the default 128 keeps them compiled.
+            self.conn = sqlite3.connect(
+                db_path, check_same_thread=False, cached_statements=256,
+            )
+            # Measurements are inserted from a QThreadPool worker while the
+            # UI thread keeps reading. Every write method holds this lock
+            # so one thread's commit can't land in the middle of another's
+            # transaction; inserts also use their own cursor instead of
+            # the shared ``self.cursor``.
+            self._write_lock = threading.Lock()
+            # Assembled filter SQL per (base query, active-filter bitmask).
+            # There are few combinations in practice, so each string is
+            # built once and hits the same compiled statement afterwards.
+            self._filter_sql_cache: dict[tuple[str, int], str] = {}
+            # Bumped on every write to the measurements table so views can
+            # tell whether their cached query results are still current.
+            self.data_version = 0
+            # Distinct values per column as (data_version, values); reused
+            # by the filter combos until the next write.
+            self._unique_values_cache: dict[str, tuple[int, list[str]]] = {}
             self.conn.row_factory = sqlite3.Row
             # WAL is faster but leaves -shm/-wal sidecar files around between
             # runs. DELETE journal mode keeps the working directory clean and
             # is plenty fast for the single-writer workload here.
             self.conn.execute("PRAGMA journal_mode=DELETE")
             self.conn.execute("PRAGMA synchronous=NORMAL")
+            # Read-side tuning for the history/CSV queries: memory-map up
+            # to 256 MB of the DB file, keep ~20 MB of page cache and put
+            # sort/temp B-trees in RAM.
+            self.conn.execute("PRAGMA mmap_size=268435456")
+            self.conn.execute("PRAGMA cache_size=-20000")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
             self.cursor = self.conn.cursor()
 
             self._create_measurements_table()
             self._create_calibrations_table()
+            self._create_material_cache_table()
             self._create_indexes()
         except (sqlite3.Error, OSError) as e:
             logger.error("Database connection/setup error at %s: %s", db_path, e)
@@ -118,6 +162,19 @@ class DatabaseService:
         """)
         self.conn.commit()
 
+    def _create_material_cache_table(self):
+        # Parsed material catalog, keyed by source file and invalidated by
+        # its mtime/size (see MaterialService).
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS material_cache (
+                Source      TEXT PRIMARY KEY,
+                MtimeNs     INTEGER NOT NULL,
+                Size        INTEGER NOT NULL,
+                Payload     TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
     def _create_indexes(self):
         indexes = [
             ("idx_meas_date",    "measurements(Date DESC)"),
@@ -128,6 +185,8 @@ class DatabaseService:
             ("idx_meas_session", "measurements(SessionTag)"),
             ("idx_meas_mode",    "measurements(Mode)"),
             ("idx_meas_probe",   "measurements(Probe)"),
+            ("idx_meas_refimg",  "measurements(RefImage)"),
+            ("idx_meas_matimg",  "measurements(MatImage)"),
             ("idx_cal_material", "calibrations(Shelf, Book, Page, Wavelength, Mode)"),
             ("idx_cal_active",   "calibrations(IsActive)"),
             ("idx_cal_session",  "calibrations(SessionTag)"),
@@ -154,36 +213,74 @@ class DatabaseService:
         try:
             columns      = ", ".join(clean.keys())
             placeholders = ", ".join(f":{k}" for k in clean.keys())
-            self.cursor.execute(
-                f"INSERT INTO measurements ({columns}) VALUES ({placeholders})",
-                clean,
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            with self._write_lock:
+                cur = self.conn.execute(
+                    f"INSERT INTO measurements ({columns}) VALUES ({placeholders})",
+                    clean,
+                )
+                self.conn.commit()
+                self.data_version += 1
+                return cur.lastrowid
         except sqlite3.Error as e:
             logger.error("Error saving measurement: %s", e)
             return -1
 
     def delete_measurement(self, measurement_id: int) -> bool:
         try:
-            self.cursor.execute(
-                "SELECT RefImage, MatImage FROM measurements WHERE id = ?",
-                (measurement_id,),
-            )
-            row = self.cursor.fetchone()
-            self.cursor.execute(
-                "DELETE FROM measurements WHERE id = ?", (measurement_id,)
-            )
-            self.conn.commit()
-            row_was_deleted = self.cursor.rowcount > 0
-            if row and row_was_deleted:
-                self._delete_image_file(row["RefImage"])
-                self._delete_image_file(row["MatImage"])
+            # The reference check and unlink happen under the write lock,
+            # so they can't interleave with a SaveWorker's INSERT of a row
+            # that reuses the same content-addressed image.
+            with self._write_lock:
+                self.cursor.execute(
+                    "SELECT RefImage, MatImage FROM measurements WHERE id = ?",
+                    (measurement_id,),
+                )
+                row = self.cursor.fetchone()
+                self.cursor.execute(
+                    "DELETE FROM measurements WHERE id = ?", (measurement_id,)
+                )
+                self.conn.commit()
+                row_was_deleted = self.cursor.rowcount > 0
+                if row_was_deleted:
+                    self.data_version += 1
+                if row and row_was_deleted:
+                    # Image files are content-addressed and may be shared
+                    # (e.g. one reference for a series), so only remove
+                    # those no remaining row points at.
+                    for filename in {row["RefImage"], row["MatImage"]}:
+                        if not self._image_is_referenced(filename):
+                            self._delete_image_file(filename)
             return row_was_deleted
         except sqlite3.Error as e:
             logger.error("Error deleting measurement %s: %s", measurement_id, e)
             return False
 
+    def update_measurement_field(
+        self, measurement_id: int, column: str, value: Any,
+    ) -> bool:
+        """
+        Sets one column of one measurement. ``column`` must be a known
+        measurements column, so the f-string below is safe.
+        """
+        if column not in VALID_COLUMNS:
+            logger.error("Rejected update to column %s", column)
+            return False
+        try:
+            with self._write_lock:
+                cur = self.conn.execute(
+                    f"UPDATE measurements SET {column} = ? WHERE id = ?",
+                    (value, measurement_id),
+                )
+                self.conn.commit()
+                updated = cur.rowcount > 0
+                if updated:
+                    self.data_version += 1
+                return updated
+        except sqlite3.Error as e:
+            logger.error("Error updating %s of measurement %s: %s",
+                         column, measurement_id, e)
+            return False
+
     # ==================================================================
     # Measurements - read (single)
     # ==================================================================
@@ -217,32 +314,29 @@ class DatabaseService:
         mode_filter: str | None = None,
         probe:       str | None = None,
     ) -> tuple[str, dict[str, Any]]:
-        where_clauses: list[str] = []
-        params: dict[str, Any]  = {}
-        if name_filter:
-            where_clauses.append("Name = :name");              params["name"] = name_filter
-        if start_date:
-            where_clauses.append("DATE(Date) >= :start_date"); params["start_date"] = start_date
-        if end_date:
-            where_clauses.append("DATE(Date) <= :end_date");   params["end_date"] = end_date
-        if shelf:
-            where_clauses.append("Shelf = :shelf");            params["shelf"] = shelf
-        if book:
-            where_clauses.append("Book = :book");              params["book"] = book
-        if page:
-            where_clauses.append("Page = :page");              params["page"] = page
+        values = (
+            name_filter, start_date, end_date, shelf, book, page,
+            note_filter, session_tag, mode_filter, probe,
+        )
+        mask = 0
+        params: dict[str, Any] = {}
+        for bit, ((_, param), value) in enumerate(zip(_FILTER_CLAUSES, values)):
+            if value:
+                mask |= 1 << bit
+                params[param] = value
         if note_filter:
-            where_clauses.append("Note LIKE :note");           params["note"] = f"%{note_filter}%"
-        if session_tag:
-            where_clauses.append("SessionTag = :session_tag"); params["session_tag"] = session_tag
-        if mode_filter:
-            where_clauses.append("Mode = :mode_filter");       params["mode_filter"] = mode_filter
-        if probe:
-            where_clauses.append("Probe = :probe");            params["probe"] = probe
-
-        query = base_query
-        if where_clauses:
-            query += " WHERE " + " AND ".join(where_clauses)
+            params["note"] = f"%{note_filter}%"
+
+        query = self._filter_sql_cache.get((base_query, mask))
+        if query is None:
+            where_clauses = [
+                clause for bit, (clause, _) in enumerate(_FILTER_CLAUSES)
+                if mask & (1 << bit)
+            ]
+            query = base_query
+            if where_clauses:
+                query += " WHERE " + " AND ".join(where_clauses)
+            self._filter_sql_cache[(base_query, mask)] = query
         return query, params
 
     def get_measurements(
@@ -282,8 +376,9 @@ class DatabaseService:
             total = int(rows[0]["__total"]) if rows else 0
             for r in rows:
                 r.pop("__total", None)
-            if total == 0:
-                # Empty page may still have data on earlier pages.
+            if total == 0 and offset > 0:
+                # Empty page may still have data on earlier pages. On the
+                # first page an empty result already means a total of 0.
                 total = self.get_measurements_count(
                     name_filter, start_date, end_date, shelf, book, page,
                     note_filter, session_tag, mode_filter, probe,
@@ -293,6 +388,85 @@ class DatabaseService:
             logger.error("Error fetching measurements: %s", e)
             return [], 0
 
+    def get_measurements_after(
+        self,
+        name_filter: str | None = None, start_date: str | None = None,
+        end_date:    str | None = None, shelf: str | None = None,
+        book:        str | None = None, page: str | None = None,
+        note_filter: str | None = None, session_tag: str | None = None,
+        mode_filter: str | None = None, probe: str | None = None,
+        after:       tuple[str, int] | None = None,
+        limit:       int = 20, order_dir: str = "DESC",
+    ) -> list[dict[str, Any]]:
+        """
+        Keyset-paginated read ordered by ``(Date, id)``. ``after`` is the
+        ``(Date, id)`` of the last row of the previous page (None for the
+        first page). Unlike OFFSET paging, the cost of a page doesn't
+        grow with how deep it is, and no total count is computed.
+        """
+        rows = self._select_after(
+            "SELECT * FROM measurements",
+            (name_filter, start_date, end_date, shelf, book, page,
+             note_filter, session_tag, mode_filter, probe),
+            after, limit, order_dir,
+        )
+        return [dict(r) for r in rows] if rows is not None else []
+
+    def get_measurement_rows_after(
+        self,
+        columns:     tuple[str, ...],
+        name_filter: str | None = None, start_date: str | None = None,
+        end_date:    str | None = None, shelf: str | None = None,
+        book:        str | None = None, page: str | None = None,
+        note_filter: str | None = None, session_tag: str | None = None,
+        mode_filter: str | None = None, probe: str | None = None,
+        after:       tuple[str, int] | None = None,
+        limit:       int = 20, order_dir: str = "DESC",
+    ) -> list[tuple] | None:
+        """
+        Same paging as ``get_measurements_after`` but only reads
+        ``columns``, returned as plain tuples laid out
+        ``(id, Date, *columns)`` for positional access. Returns None if
+        the query fails, so callers can tell an error from the end of
+        the data.
+        """
+        if not columns or not all(c in VALID_COLUMNS for c in columns):
+            logger.warning("Invalid column list requested: %s", columns)
+            return None
+        rows = self._select_after(
+            f"SELECT id, Date, {', '.join(columns)} FROM measurements",
+            (name_filter, start_date, end_date, shelf, book, page,
+             note_filter, session_tag, mode_filter, probe),
+            after, limit, order_dir,
+        )
+        return [tuple(r) for r in rows] if rows is not None else None
+
+    def _select_after(
+        self,
+        base_query: str,
+        filters:    tuple[str | None, ...],
+        after:      tuple[str, int] | None,
+        limit:      int,
+        order_dir:  str,
+    ) -> list[sqlite3.Row] | None:
+        safe_order_dir = order_dir if order_dir in ("ASC", "DESC") else "DESC"
+        query, params = self._build_filter_query(base_query, *filters)
+        if after is not None:
+            op = "<" if safe_order_dir == "DESC" else ">"
+            # Every filter contributes a parameter, so params tells
+            # whether a WHERE clause is already present.
+            query += " AND " if params else " WHERE "
+            query += f"(Date, id) {op} (:after_date, :after_id)"
+            params["after_date"], params["after_id"] = after
+        query += f" ORDER BY Date {safe_order_dir}, id {safe_order_dir} LIMIT :limit"
+        params["limit"] = limit
+
+        try:
+            return self.conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error fetching measurements: %s", e)
+            return None
+
     def get_all_filtered_measurements(
         self,
         name_filter: str | None = None, start_date: str | None = None,
@@ -332,9 +506,10 @@ class DatabaseService:
             name_filter, start_date, end_date, shelf, book, page,
             note_filter, session_tag, mode_filter, probe,
         )
+        # Own cursor: the export page runs this on a pool thread, where
+        # sharing self.cursor with the GUI thread would mix result sets.
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchone()[0]
+            return self.conn.execute(query, params).fetchone()[0]
         except sqlite3.Error as e:
             logger.error("Error counting measurements: %s", e)
             return 0
@@ -452,12 +627,13 @@ class DatabaseService:
         try:
             columns      = ", ".join(clean.keys())
             placeholders = ", ".join(f":{k}" for k in clean.keys())
-            self.cursor.execute(
-                f"INSERT INTO calibrations ({columns}) VALUES ({placeholders})",
-                clean,
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            with self._write_lock:
+                self.cursor.execute(
+                    f"INSERT INTO calibrations ({columns}) VALUES ({placeholders})",
+                    clean,
+                )
+                self.conn.commit()
+                return self.cursor.lastrowid
         except sqlite3.Error as e:
             logger.error("Error saving calibration: %s", e)
             return -1
@@ -505,11 +681,12 @@ class DatabaseService:
 
     def delete_calibration(self, calibration_id: int) -> bool:
         try:
-            self.cursor.execute(
-                "DELETE FROM calibrations WHERE id = ?", (calibration_id,)
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
+            with self._write_lock:
+                self.cursor.execute(
+                    "DELETE FROM calibrations WHERE id = ?", (calibration_id,)
+                )
+                self.conn.commit()
+                return self.cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error("Error deleting calibration %s: %s", calibration_id, e)
             return False
@@ -550,21 +727,22 @@ class DatabaseService:
                 logger.warning("set_active_calibration: id %s not found", calibration_id)
                 return False
 
-            self.cursor.execute("BEGIN")
-            self.cursor.execute(
-                """
-                UPDATE calibrations SET IsActive = 0
-                 WHERE Shelf=? AND Book=? AND Page=?
-                   AND Wavelength=? AND Mode=?
-                """,
-                (row["Shelf"], row["Book"], row["Page"],
-                 row["Wavelength"], row["Mode"]),
-            )
-            self.cursor.execute(
-                "UPDATE calibrations SET IsActive = 1 WHERE id = ?",
-                (calibration_id,),
-            )
-            self.conn.commit()
+            with self._write_lock:
+                self.cursor.execute("BEGIN")
+                self.cursor.execute(
+                    """
+                    UPDATE calibrations SET IsActive = 0
+                     WHERE Shelf=? AND Book=? AND Page=?
+                       AND Wavelength=? AND Mode=?
+                    """,
+                    (row["Shelf"], row["Book"], row["Page"],
+                     row["Wavelength"], row["Mode"]),
+                )
+                self.cursor.execute(
+                    "UPDATE calibrations SET IsActive = 1 WHERE id = ?",
+                    (calibration_id,),
+                )
+                self.conn.commit()
             return True
         except sqlite3.Error as e:
             logger.error("Error setting active calibration %s: %s", calibration_id, e)
@@ -573,16 +751,51 @@ class DatabaseService:
 
     def deactivate_calibration(self, calibration_id: int) -> bool:
         try:
-            self.cursor.execute(
-                "UPDATE calibrations SET IsActive = 0 WHERE id = ?",
-                (calibration_id,),
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
+            with self._write_lock:
+                self.cursor.execute(
+                    "UPDATE calibrations SET IsActive = 0 WHERE id = ?",
+                    (calibration_id,),
+                )
+                self.conn.commit()
+                return self.cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error("Error deactivating calibration %s: %s", calibration_id, e)
             return False
 
+    # ==================================================================
+    # Material catalog cache
+    # ==================================================================
+
+    def get_material_cache(
+        self, source: str, mtime_ns: int, size: int,
+    ) -> str | None:
+        """Cached catalog payload for ``source``, or None if stale/absent."""
+        try:
+            self.cursor.execute(
+                "SELECT Payload FROM material_cache "
+                "WHERE Source = ? AND MtimeNs = ? AND Size = ?",
+                (source, mtime_ns, size),
+            )
+            row = self.cursor.fetchone()
+            return row["Payload"] if row else None
+        except sqlite3.Error as e:
+            logger.error("Error reading material cache: %s", e)
+            return None
+
+    def save_material_cache(
+        self, source: str, mtime_ns: int, size: int, payload: str,
+    ) -> None:
+        try:
+            with self._write_lock:
+                self.cursor.execute(
+                    "INSERT OR REPLACE INTO material_cache "
+                    "(Source, MtimeNs, Size, Payload) VALUES (?, ?, ?, ?)",
+                    (source, mtime_ns, size, payload),
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Error writing material cache: %s", e)
+
     # ==================================================================
     # Unique-value helpers (filter ComboBoxes)
     # ==================================================================
@@ -591,13 +804,20 @@ class DatabaseService:
         if not column_name.replace("_", "").isalnum():
             logger.warning("Invalid column name requested: %s", column_name)
             return []
+        version = self.data_version
+        cached  = self._unique_values_cache.get(column_name)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+        # Own cursor: the export page loads these on a pool thread.
         try:
-            self.cursor.execute(
+            rows = self.conn.execute(
                 f"SELECT DISTINCT {column_name} FROM measurements "
                 f"WHERE {column_name} IS NOT NULL AND {column_name} != '' "
                 f"ORDER BY {column_name}"
-            )
-            return [row[column_name] for row in self.cursor.fetchall()]
+            ).fetchall()
+            values = [row[column_name] for row in rows]
+            self._unique_values_cache[column_name] = (version, values)
+            return list(values)
         except sqlite3.Error as e:
             logger.error("Error fetching unique %s values: %s", column_name, e)
             return []
@@ -610,6 +830,46 @@ class DatabaseService:
     def get_unique_sessions(self) -> list[str]: return self._get_unique_column_values("SessionTag")
     def get_unique_probes(self)   -> list[str]: return self._get_unique_column_values("Probe")
 
+    def get_unique_filter_values(self) -> dict[str, list[str]]:
+        """
+        Distinct Shelf, Book and Page values in one statement, keyed
+        ``"shelf"``/``"book"``/``"page"`` and sorted like the per-column
+        helpers.
+        """
+        values: dict[str, list[str]] = {"shelf": [], "book": [], "page": []}
+        try:
+            rows = self.conn.execute(
+                "SELECT 'shelf' AS k, Shelf AS v FROM measurements WHERE Shelf != '' "
+                "UNION SELECT 'book', Book FROM measurements WHERE Book != '' "
+                "UNION SELECT 'page', Page FROM measurements WHERE Page != '' "
+                "ORDER BY k, v"
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error fetching unique filter values: %s", e)
+            return values
+        for row in rows:
+            values[row["k"]].append(row["v"])
+        return values
+
+    def get_names_matching(self, prefix: str, limit: int = 50) -> list[str]:
+        """
+        Up to ``limit`` distinct Name values starting with ``prefix``
+        (case-insensitive), for type-ahead completion.
+        """
+        escaped = (prefix.replace("\\", "\\\\")
+                         .replace("%", "\\%").replace("_", "\\_"))
+        try:
+            rows = self.conn.execute(
+                "SELECT DISTINCT Name FROM measurements "
+                "WHERE Name LIKE ? ESCAPE '\\' AND Name != '' "
+                "ORDER BY Name LIMIT ?",
+                (f"{escaped}%", limit),
+            ).fetchall()
+            return [row["Name"] for row in rows]
+        except sqlite3.Error as e:
+            logger.error("Error fetching names matching %r: %s", prefix, e)
+            return []
+
     def get_pages_for_book(self, book: str) -> list[str]:
         """Distinct Page values seen in measurements for a given Book."""
         if not book:
@@ -647,6 +907,15 @@ class DatabaseService:
     # Housekeeping
     # ==================================================================
 
+    def _image_is_referenced(self, filename: str | None) -> bool:
+        if not filename:
+            return False
+        self.cursor.execute(
+            "SELECT 1 FROM measurements WHERE RefImage = ? OR MatImage = ? LIMIT 1",
+            (filename, filename),
+        )
+        return self.cursor.fetchone() is not None
+
     def _delete_image_file(self, filename: str | None):
         if not filename:
             return
@@ -11,7 +11,7 @@ import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from layer_thickness_app.services.database_service import (
     DatabaseService,
@@ -55,18 +55,27 @@ class ImportService:
 
     # ------------------------------------------------------------------
 
-    def import_from_zip(self, zip_filepath: str | Path) -> tuple[int, int]:
+    def import_from_zip(
+        self,
+        zip_filepath: str | Path,
+        progress:     Callable[[int, int], None] | None = None,
+    ) -> tuple[int, int, dict[str, set[str]]]:
         """
         Reads a ZIP archive, copies images to the data/images folder
-        and imports metadata into the database.
+        and imports metadata into the database. ``progress`` is called
+        with the running ``(success_count, fail_count)`` after each row.
 
-        Returns ``(success_count, fail_count)``.
+        Returns ``(success_count, fail_count, values)``, where ``values``
+        holds the Shelf/Book/Page values of the imported rows (keyed
+        ``"shelf"``/``"book"``/``"page"``) so views can extend their
+        filter lists without re-querying.
         """
         zip_path = Path(zip_filepath)
         logger.info("Starting import from %s", zip_path)
         success_count = 0
         fail_count    = 0
         temp_dir      = Path(tempfile.mkdtemp())
+        values: dict[str, set[str]] = {"shelf": set(), "book": set(), "page": set()}
 
         try:
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
@@ -75,7 +84,7 @@ class ImportService:
             csv_path = temp_dir / "measurements.csv"
             if not csv_path.exists():
                 logger.error("'measurements.csv' not found in the ZIP file.")
-                return (0, 0)
+                return (0, 0, values)
 
             csv.field_size_limit(10_485_760)
 
@@ -84,28 +93,37 @@ class ImportService:
 
                 if not reader.fieldnames:
                     logger.error("CSV file is empty or has no header: %s", csv_path)
-                    return (0, 0)
+                    return (0, 0, values)
 
                 missing = self.REQUIRED - set(reader.fieldnames)
                 if missing:
                     logger.error("CSV is missing required columns: %s", missing)
-                    return (0, 0)
+                    return (0, 0, values)
 
                 for i, row in enumerate(reader, start=2):
                     if self._process_row(i, row, temp_dir):
                         success_count += 1
+                        # Blank cells are skipped, as get_unique_* skips
+                        # empty values, so no blank combo entries appear.
+                        for key, column in (
+                            ("shelf", "Shelf"), ("book", "Book"), ("page", "Page"),
+                        ):
+                            if row[column]:
+                                values[key].add(row[column])
                     else:
                         fail_count += 1
+                    if progress is not None:
+                        progress(success_count, fail_count)
 
         except FileNotFoundError:
             logger.error("File not found at %s", zip_path)
-            return (0, 0)
+            return (0, 0, values)
         except zipfile.BadZipFile:
             logger.error("Bad ZIP file %s", zip_path)
-            return (0, 0)
+            return (0, 0, values)
         except Exception as e:
             logger.exception("Error reading ZIP file %s: %s", zip_path, e)
-            return (0, 0)
+            return (0, 0, values)
         finally:
             try:
                 shutil.rmtree(temp_dir)
@@ -117,7 +135,7 @@ class ImportService:
             "Import complete: %d rows succeeded, %d rows failed.",
             success_count, fail_count,
         )
-        return (success_count, fail_count)
+        return (success_count, fail_count, values)
 
     # ------------------------------------------------------------------
 
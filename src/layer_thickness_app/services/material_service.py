@@ -2,24 +2,33 @@
 Material catalog loader. Locates and parses the refractiveindex.info
 ``catalog-nk.yml`` shipped with the ``refractiveindex2`` package and
 exposes it as a nested dict consumed by the MaterialSelector.
+
+Parsing the YAML is by far the slowest part of startup, so the parsed
+dict is cached in the measurements DB and reused until the catalog
+file's mtime or size changes.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 import refractiveindex2 as ri
 
+if TYPE_CHECKING:
+    from layer_thickness_app.services.database_service import DatabaseService
+
 logger = logging.getLogger(__name__)
 
 
 class MaterialService:
     """Loads and parses the refractiveindex.info material catalog."""
 
-    def __init__(self):
+    def __init__(self, db_service: "DatabaseService | None" = None):
+        self.db_service = db_service
         try:
             self.material_data: dict[str, Any] = self._load_and_parse_catalog()
             logger.info("Material catalog loaded successfully.")
@@ -75,6 +84,10 @@ class MaterialService:
         Parse the nested catalog-nk.yml into a dict suitable for the
         cascading shelf/book/page combo boxes. DIVIDER entries are kept
         as un-selectable separators with synthetic keys.
+
+        Shelf/book/page ids are stored as str: YAML reads ids such as
+        ``1975`` as ints, and the JSON cache would turn those keys into
+        strings anyway, so a fresh parse and a cache hit must agree.
         """
         data_structure: dict[str, Any] = {}
         try:
@@ -94,7 +107,7 @@ class MaterialService:
                 data_structure[key] = {"name": top_level_item["DIVIDER"], "books": {}}
                 divider_count += 1
             elif "SHELF" in top_level_item:
-                shelf_key  = top_level_item["SHELF"]
+                shelf_key  = str(top_level_item["SHELF"])
                 shelf_name = top_level_item.get("name", shelf_key)
                 data_structure[shelf_key] = {"name": shelf_name, "books": {}}
 
@@ -106,7 +119,7 @@ class MaterialService:
                         }
                         divider_count += 1
                     elif "BOOK" in book_item:
-                        book_key  = book_item["BOOK"]
+                        book_key  = str(book_item["BOOK"])
                         book_name = book_item.get("name", book_key)
                         current_book_entry = {"name": book_name, "pages": {}}
                         data_structure[shelf_key]["books"][book_key] = current_book_entry
@@ -119,7 +132,7 @@ class MaterialService:
                                 }
                                 divider_count += 1
                             elif "PAGE" in page_item:
-                                page_key  = page_item["PAGE"]
+                                page_key  = str(page_item["PAGE"])
                                 page_name = page_item.get("name", page_key)
                                 current_book_entry["pages"][page_key] = {"name": page_name}
 
@@ -127,4 +140,22 @@ class MaterialService:
 
     def _load_and_parse_catalog(self) -> dict[str, Any]:
         catalog_path = self._find_catalog_path()
-        return self._parse_catalog_yml(catalog_path)
\ No newline at end of file
+        if self.db_service is None:
+            return self._parse_catalog_yml(catalog_path)
+
+        st     = catalog_path.stat()
+        source = str(catalog_path)
+        cached = self.db_service.get_material_cache(source, st.st_mtime_ns, st.st_size)
+        if cached is not None:
+            try:
+                return json.loads(cached)
+            except json.JSONDecodeError as e:
+                logger.warning("Discarding corrupt material cache: %s", e)
+
+        data = self._parse_catalog_yml(catalog_path)
+        # An empty dict means the parse failed; don't pin that in the cache.
+        if data:
+            self.db_service.save_material_cache(
+                source, st.st_mtime_ns, st.st_size, json.dumps(data),
+            )
+        return data
\ No newline at end of file